@@ -0,0 +1,5 @@
+from app.db.base import Base
+from app.db.engine import engine, init_db
+from app.db.session import SessionLocal, get_request_session
+
+__all__ = ["Base", "SessionLocal", "engine", "get_request_session", "init_db"]
@@ -1,5 +1,17 @@
+from contextvars import ContextVar
+
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.db.engine import engine
 
 SessionLocal = async_sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
+
+_request_session: ContextVar[AsyncSession | None] = ContextVar("db_session", default=None)
+
+
+def get_request_session() -> AsyncSession:
+    session = _request_session.get()
+    if session is None:
+        session = SessionLocal()
+        _request_session.set(session)
+    return session
@@ -1,21 +1,31 @@
+import base64
 import hashlib
 import hmac
-import json
 import logging
-import os
-from datetime import datetime, timezone
+import time
+from datetime import datetime
+from functools import lru_cache
 from typing import Any
-from urllib.parse import parse_qsl, unquote
+from urllib.parse import unquote
 
 import jwt
+import orjson
+from cachetools import TTLCache
 from fastapi import Depends, Header, HTTPException, Request, status
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import bindparam, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import SessionLocal
+from app.db import get_request_session
+from app.env_cache import env_int, env_str
 from app.models import User, UserPremium
-from app.services.rate_limit import check_rate_limit, hash_token
+from app.services.rate_limit import (
+    check_rate_limit,
+    hash_token,
+    is_locally_denied,
+    remember_denial,
+)
 
 logger = logging.getLogger("kina.api")
 
@@ -33,19 +43,18 @@ class BannedUserError(Exception):
 
 
 async def get_db_session() -> AsyncSession:
-    async with SessionLocal() as session:
-        yield session
+    return get_request_session()
 
 
 def _is_dev_bypass_allowed() -> bool:
-    environment = os.getenv("ENVIRONMENT")
+    environment = env_str("ENVIRONMENT")
     return environment in {"local", "development", "dev"}
 
 
 def _get_dev_user_id(dev_user_id: str | None) -> int:
     if dev_user_id:
         return int(dev_user_id)
-    env_user_id = os.getenv("DEV_TG_USER_ID")
+    env_user_id = env_str("DEV_TG_USER_ID")
     if env_user_id:
         return int(env_user_id)
     raise HTTPException(
@@ -55,14 +64,14 @@ def _get_dev_user_id(dev_user_id: str | None) -> int:
 
 
 def _is_webapp_debug_enabled() -> bool:
-    return os.getenv("AUTH_WEBAPP_DEBUG", "0") == "1"
+    return env_str("AUTH_WEBAPP_DEBUG", "0") == "1"
 
 
 def _get_bot_token() -> str:
     token = (
-        os.getenv("BOT_TOKEN")
-        or os.getenv("TELEGRAM_BOT_TOKEN")
-        or os.getenv("WEBAPP_BOT_TOKEN")
+        env_str("BOT_TOKEN")
+        or env_str("TELEGRAM_BOT_TOKEN")
+        or env_str("WEBAPP_BOT_TOKEN")
     )
     if not token:
         raise HTTPException(
@@ -72,19 +81,37 @@ def _get_bot_token() -> str:
     return token
 
 
+_TG_WEBAPP_DATA_KEY = "tgWebAppData="
+
+
 def _extract_tg_webapp_data(init_data: str) -> str:
     normalized = init_data.strip()
-    if normalized.startswith("?") or normalized.startswith("#"):
+    if normalized[:1] in ("?", "#"):
         normalized = normalized[1:]
-    if "tgWebAppData=" not in normalized:
+    start = normalized.find(_TG_WEBAPP_DATA_KEY)
+    while start > 0 and normalized[start - 1] != "&":
+        start = normalized.find(_TG_WEBAPP_DATA_KEY, start + 1)
+    if start < 0:
         return normalized
-    for part in normalized.split("&"):
-        if not part:
-            continue
-        key, _, value = part.partition("=")
-        if key == "tgWebAppData":
-            return unquote(value)
-    return normalized
+    start += len(_TG_WEBAPP_DATA_KEY)
+    end = normalized.find("&", start)
+    wrapped = normalized[start:] if end < 0 else normalized[start:end]
+    return unquote(wrapped) if "%" in wrapped else wrapped
+
+
+@lru_cache(maxsize=4)
+def _get_webapp_hmac(bot_token: str) -> hmac.HMAC:
+    secret_key = hmac.digest(b"WebAppData", bot_token.encode("utf-8"), "sha256")
+    return hmac.new(secret_key, digestmod=hashlib.sha256)
+
+
+def _decode_sha256_hex(value: str) -> bytes | None:
+    if len(value) != 64:
+        return None
+    try:
+        return bytes.fromhex(value)
+    except ValueError:
+        return None
 
 
 def _validate_init_data(init_data: str, bot_token: str, *, debug: bool = False) -> dict[str, Any]:
@@ -107,18 +134,18 @@ def _validate_init_data(init_data: str, bot_token: str, *, debug: bool = False)
             )
 
     normalized = _extract_tg_webapp_data(init_data)
-    try:
-        pairs = parse_qsl(normalized, strict_parsing=True, keep_blank_values=True)
-    except ValueError as exc:
-        _log_failure("parse_error")
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="init_data_invalid",
-        ) from exc
-
     data: dict[str, str] = {}
     hash_from_tg: str | None = None
-    for key, value in pairs:
+    for part in normalized.split("&") if normalized else ():
+        key, sep, value = part.partition("=")
+        if not sep:
+            _log_failure("parse_error")
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="init_data_invalid",
+            )
+        if "%" in value or "+" in value:
+            value = unquote(value.replace("+", " "))
         if key == "hash":
             hash_from_tg = value
             has_hash = True
@@ -135,19 +162,19 @@ def _validate_init_data(init_data: str, bot_token: str, *, debug: bool = False)
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="init_data_invalid",
         )
+    expected_hash = _decode_sha256_hex(hash_from_tg)
+    if expected_hash is None:
+        _log_failure("hash_format")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="init_data_invalid",
+        )
 
-    data_check_string = "\n".join(f"{key}={data[key]}" for key in sorted(data))
-    secret_key = hmac.new(
-        b"WebAppData",
-        bot_token.encode("utf-8"),
-        hashlib.sha256,
-    ).digest()
-    calculated_hash = hmac.new(
-        secret_key,
-        data_check_string.encode("utf-8"),
-        hashlib.sha256,
-    ).hexdigest()
-    if not hmac.compare_digest(calculated_hash, hash_from_tg):
+    data_check_string = "\n".join([f"{key}={data[key]}" for key in sorted(data)]).encode("utf-8")
+    mac = _get_webapp_hmac(bot_token).copy()
+    mac.update(data_check_string)
+    calculated_hash = mac.digest()
+    if not hmac.compare_digest(calculated_hash, expected_hash):
         _log_failure("hash_mismatch")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -170,9 +197,9 @@ def _validate_init_data(init_data: str, bot_token: str, *, debug: bool = False)
             detail="init_data_invalid",
         ) from exc
 
-    now_ts = int(datetime.now(timezone.utc).timestamp())
-    max_age = int(os.getenv("AUTH_WEBAPP_MAX_AGE_SECONDS", "86400"))
-    clock_skew = int(os.getenv("AUTH_WEBAPP_CLOCK_SKEW_SECONDS", "120"))
+    now_ts = int(time.time())
+    max_age = env_int("AUTH_WEBAPP_MAX_AGE_SECONDS", 86400)
+    clock_skew = env_int("AUTH_WEBAPP_CLOCK_SKEW_SECONDS", 120)
     if auth_date > now_ts + clock_skew:
         _log_failure("clock_skew")
         raise HTTPException(
@@ -189,8 +216,13 @@ def _validate_init_data(init_data: str, bot_token: str, *, debug: bool = False)
     return data
 
 
+@lru_cache(maxsize=4)
+def _encode_token(value: str) -> bytes:
+    return value.encode("utf-8")
+
+
 def _get_jwt_secret() -> str:
-    secret = os.getenv("JWT_SECRET") or os.getenv("BOT_TOKEN")
+    secret = env_str("JWT_SECRET") or env_str("BOT_TOKEN")
     if not secret:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -200,28 +232,82 @@ def _get_jwt_secret() -> str:
 
 
 def _get_jwt_ttl_seconds() -> int:
-    ttl = int(os.getenv("JWT_TTL_SECONDS", "43200"))
+    ttl = env_int("JWT_TTL_SECONDS", 43200)
     min_ttl = 21600
     max_ttl = 86400
     return max(min_ttl, min(max_ttl, ttl))
 
 
+def _get_jwt_secret_bytes() -> bytes:
+    return _encode_token(_get_jwt_secret())
+
+
+def _b64url_decode(segment: str) -> bytes:
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def _b64url_encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+_JWT_HS256_HEADER = _b64url_encode(orjson.dumps({"alg": "HS256", "typ": "JWT"}))
+
+
+def _encode_hs256(payload: dict[str, Any], secret: bytes) -> str:
+    signing_input = f"{_JWT_HS256_HEADER}.{_b64url_encode(orjson.dumps(payload))}"
+    signature = hmac.digest(secret, signing_input.encode("ascii"), "sha256")
+    return f"{signing_input}.{_b64url_encode(signature)}"
+
+
 def _issue_access_token(user: User) -> tuple[str, int]:
     ttl = _get_jwt_ttl_seconds()
-    now = datetime.now(timezone.utc)
+    now_ts = int(time.time())
     payload = {
         "sub": str(user.id),
         "tg_user_id": user.tg_user_id,
-        "iat": int(now.timestamp()),
-        "exp": int((now.timestamp() + ttl)),
+        "iat": now_ts,
+        "exp": now_ts + ttl,
     }
-    token = jwt.encode(payload, _get_jwt_secret(), algorithm="HS256")
+    token = _encode_hs256(payload, _get_jwt_secret_bytes())
     return token, ttl
 
 
+def _fast_decode_hs256(token: str, secret: bytes) -> dict[str, Any]:
+    try:
+        header_segment, payload_segment, signature_segment = token.split(".")
+        header = orjson.loads(_b64url_decode(header_segment))
+        signature = _b64url_decode(signature_segment)
+        signing_input = f"{header_segment}.{payload_segment}".encode("ascii")
+    except ValueError as exc:
+        raise jwt.DecodeError("malformed_token") from exc
+    if not isinstance(header, dict) or header.get("alg") != "HS256":
+        raise jwt.InvalidAlgorithmError("unsupported_alg")
+    if not hmac.compare_digest(hmac.digest(secret, signing_input, "sha256"), signature):
+        raise jwt.InvalidSignatureError("bad_signature")
+    try:
+        payload = orjson.loads(_b64url_decode(payload_segment))
+    except ValueError as exc:
+        raise jwt.DecodeError("malformed_payload") from exc
+    if not isinstance(payload, dict):
+        raise jwt.DecodeError("malformed_payload")
+    exp = payload.get("exp")
+    if not isinstance(exp, int):
+        raise jwt.InvalidTokenError("exp_missing")
+    if exp <= int(time.time()):
+        raise jwt.ExpiredSignatureError("token_expired")
+    return payload
+
+
+_verified_tokens: TTLCache[bytes, dict[str, Any]] = TTLCache(maxsize=10_000, ttl=10)
+
+
 def _decode_access_token(token: str) -> dict[str, Any]:
+    cache_key = hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+    payload = _verified_tokens.get(cache_key)
+    if payload is not None and payload["exp"] > time.time():
+        return payload
     try:
-        return jwt.decode(token, _get_jwt_secret(), algorithms=["HS256"])
+        payload = _fast_decode_hs256(token, _get_jwt_secret_bytes())
     except jwt.ExpiredSignatureError as exc:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -232,42 +318,92 @@ def _decode_access_token(token: str) -> dict[str, Any]:
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="token_invalid",
         ) from exc
+    _verified_tokens[cache_key] = payload
+    return payload
 
 
-async def _upsert_user(
+_SELECT_USER_WITH_PREMIUM = select(User, UserPremium.premium_until).outerjoin(
+    UserPremium, UserPremium.user_id == User.id
+)
+_SELECT_USER_BY_ID = _SELECT_USER_WITH_PREMIUM.where(User.id == bindparam("user_id"))
+_SELECT_USER_BY_TG_ID = _SELECT_USER_WITH_PREMIUM.where(
+    User.tg_user_id == bindparam("tg_user_id")
+).execution_options(populate_existing=True)
+
+
+async def load_user_with_premium(
+    session: AsyncSession, tg_user_id: int
+) -> tuple[User, datetime | None] | None:
+    result = await session.execute(_SELECT_USER_BY_TG_ID, {"tg_user_id": tg_user_id})
+    row = result.one_or_none()
+    if row is None:
+        return None
+    user, premium_until = row
+    return user, premium_until
+
+
+async def _upsert_user_with_premium(
     session: AsyncSession,
     tg_user_id: int,
     username: str | None,
     first_name: str | None,
     language_code: str | None,
-) -> User:
-    result = await session.execute(select(User).where(User.tg_user_id == tg_user_id))
-    user = result.scalar_one_or_none()
-    if user is None:
-        user = User(
-            tg_user_id=tg_user_id,
-            username=username,
-            first_name=first_name,
-            language_code=language_code,
+) -> tuple[User, datetime | None]:
+    profile_missing = username is None and first_name is None and language_code is None
+    row = await load_user_with_premium(session, tg_user_id)
+    if row is not None:
+        user, premium_until = row
+        if not profile_missing and (user.username, user.first_name, user.language_code) != (
+            username,
+            first_name,
+            language_code,
+        ):
+            user.username = username
+            user.first_name = first_name
+            user.language_code = language_code
+            await session.commit()
+        return user, premium_until
+
+    stmt = pg_insert(User).values(
+        tg_user_id=tg_user_id,
+        username=username,
+        first_name=first_name,
+        language_code=language_code,
+    )
+    if profile_missing:
+        stmt = stmt.on_conflict_do_nothing(index_elements=[User.tg_user_id])
+    else:
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[User.tg_user_id],
+            set_={
+                "username": stmt.excluded.username,
+                "first_name": stmt.excluded.first_name,
+                "language_code": stmt.excluded.language_code,
+            },
+            where=or_(
+                User.username.is_distinct_from(stmt.excluded.username),
+                User.first_name.is_distinct_from(stmt.excluded.first_name),
+                User.language_code.is_distinct_from(stmt.excluded.language_code),
+            ),
         )
-        session.add(user)
-        await session.commit()
-        await session.refresh(user)
-        return user
-
-    user.username = username
-    user.first_name = first_name
-    user.language_code = language_code
+    await session.execute(stmt)
     await session.commit()
-    await session.refresh(user)
-    return user
+    result = await session.execute(_SELECT_USER_BY_TG_ID, {"tg_user_id": tg_user_id})
+    user, premium_until = result.one()
+    return user, premium_until
 
 
-async def _get_premium_until(session: AsyncSession, user_id: int) -> datetime | None:
-    result = await session.execute(
-        select(UserPremium.premium_until).where(UserPremium.user_id == user_id)
+async def _upsert_user(
+    session: AsyncSession,
+    tg_user_id: int,
+    username: str | None,
+    first_name: str | None,
+    language_code: str | None,
+) -> User:
+    user, _ = await _upsert_user_with_premium(
+        session, tg_user_id, username, first_name, language_code
     )
-    return result.scalar_one_or_none()
+    return user
 
 
 def _ensure_not_banned(user: User) -> None:
@@ -275,58 +411,70 @@ def _ensure_not_banned(user: User) -> None:
         raise BannedUserError()
 
 
+def _build_current_user(
+    request: Request, user: User, premium_until: datetime | None
+) -> CurrentUser:
+    _ensure_not_banned(user)
+    request.state.tg_user_id = user.tg_user_id
+    return CurrentUser.model_construct(
+        id=user.id,
+        tg_user_id=user.tg_user_id,
+        username=user.username,
+        first_name=user.first_name,
+        premium_until=premium_until,
+    )
+
+
+def _authenticate_bearer(authorization: str) -> dict[str, int]:
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="token_invalid",
+        )
+    payload = _decode_access_token(token)
+    user_id_raw = payload.get("sub")
+    if not user_id_raw:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="token_user_missing",
+        )
+    try:
+        user_id = int(user_id_raw)
+    except (TypeError, ValueError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="token_invalid",
+        ) from exc
+    return {"id": user_id, "tg_user_id": payload.get("tg_user_id")}
+
+
 async def get_current_user(
     request: Request,
-    authorization: str | None = Header(default=None, alias="Authorization"),
     x_init_data: str | None = Header(default=None, alias="X-Init-Data"),
     x_dev_user_id: str | None = Header(default=None, alias="X-Dev-User-Id"),
     session: AsyncSession = Depends(get_db_session),
 ) -> CurrentUser:
-    if authorization:
-        scheme, _, token = authorization.partition(" ")
-        if scheme.lower() != "bearer" or not token:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="token_invalid",
-            )
-        payload = _decode_access_token(token)
-        user_id_raw = payload.get("sub")
-        if not user_id_raw:
+    auth_error = getattr(request.state, "auth_error", None)
+    if auth_error:
+        status_code, detail = auth_error
+        raise HTTPException(status_code=status_code, detail=detail)
+    auth = getattr(request.state, "auth", None)
+    if auth is not None:
+        result = await session.execute(_SELECT_USER_BY_ID, {"user_id": auth["id"]})
+        row = result.one_or_none()
+        if row is None:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="token_user_missing",
             )
-        result = await session.execute(select(User).where(User.id == int(user_id_raw)))
-        user = result.scalar_one_or_none()
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="token_user_missing",
-            )
-        premium_until = await _get_premium_until(session, user.id)
-        _ensure_not_banned(user)
-        request.state.tg_user_id = user.tg_user_id
-        return CurrentUser(
-            id=user.id,
-            tg_user_id=user.tg_user_id,
-            username=user.username,
-            first_name=user.first_name,
-            premium_until=premium_until,
-        )
+        user, premium_until = row
+        return _build_current_user(request, user, premium_until)
 
     if _is_dev_bypass_allowed():
         tg_user_id = _get_dev_user_id(x_dev_user_id)
-        user = await _upsert_user(session, tg_user_id, None, None, None)
-        premium_until = await _get_premium_until(session, user.id)
-        _ensure_not_banned(user)
-        request.state.tg_user_id = user.tg_user_id
-        return CurrentUser(
-            id=user.id,
-            tg_user_id=user.tg_user_id,
-            username=user.username,
-            first_name=user.first_name,
-            premium_until=premium_until,
-        )
+        user, premium_until = await _upsert_user_with_premium(session, tg_user_id, None, None, None)
+        return _build_current_user(request, user, premium_until)
 
     if not x_init_data:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="token_missing")
@@ -335,52 +483,67 @@ async def get_current_user(
     raw_user = parsed.get("user")
     if not raw_user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="init_data_user_missing")
-    user_payload = json.loads(raw_user)
+    user_payload = orjson.loads(raw_user)
     tg_user_id = int(user_payload["id"])
-    user = await _upsert_user(
+    user, premium_until = await _upsert_user_with_premium(
         session,
         tg_user_id,
         user_payload.get("username"),
         user_payload.get("first_name"),
         user_payload.get("language_code"),
     )
-    premium_until = await _get_premium_until(session, user.id)
-    _ensure_not_banned(user)
-    request.state.tg_user_id = user.tg_user_id
-    return CurrentUser(
-        id=user.id,
-        tg_user_id=user.tg_user_id,
-        username=user.username,
-        first_name=user.first_name,
-        premium_until=premium_until,
-    )
+    return _build_current_user(request, user, premium_until)
 
 
 def is_premium_active(premium_until: datetime | None) -> bool:
     if not premium_until:
         return False
-    return premium_until > datetime.now(timezone.utc)
+    return premium_until.timestamp() > time.time()
+
+
+@lru_cache(maxsize=8)
+def _token_rate_limit_key(token: bytes) -> str:
+    return f"ratelimit:token:{hash_token(token.decode('utf-8'))}"
 
 
-async def _rate_limit_token(token: str, limit: int) -> None:
-    key = f"ratelimit:token:{hash_token(token)}"
+async def _rate_limit_by_key(key: str, limit: int) -> None:
+    if is_locally_denied(key):
+        raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail="rate_limited")
     result = await check_rate_limit(key, limit, 60)
     if not result.allowed:
+        remember_denial(key, result.retry_after)
         raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail="rate_limited")
 
 
+def _token_matches(provided: str | None, expected: bytes | None) -> bool:
+    if not expected or not provided:
+        return False
+    return hmac.compare_digest(provided.encode("utf-8"), expected)
+
+
+def _get_service_token() -> bytes | None:
+    token = env_str("SERVICE_TOKEN")
+    return _encode_token(token) if token else None
+
+
+def _get_admin_service_token() -> bytes | None:
+    token = env_str("ADMIN_SERVICE_TOKEN") or env_str("SERVICE_TOKEN")
+    return _encode_token(token) if token else None
+
+
 async def get_service_token(
     x_service_token: str | None = Header(default=None, alias="X-Service-Token"),
 ) -> None:
-    expected = os.getenv("SERVICE_TOKEN")
-    if not expected or x_service_token != expected:
+    expected = _get_service_token()
+    if not _token_matches(x_service_token, expected):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="invalid_service_token")
-    await _rate_limit_token(expected, 120)
+    await _rate_limit_by_key(_token_rate_limit_key(expected), 120)
 
 
-def _parse_admin_allowlist(raw: str | None) -> set[int]:
+@lru_cache(maxsize=4)
+def _parse_admin_allowlist(raw: str | None) -> frozenset[int]:
     if not raw:
-        return set()
+        return frozenset()
     ids: set[int] = set()
     for item in raw.split(","):
         value = item.strip()
@@ -393,18 +556,22 @@ def _parse_admin_allowlist(raw: str | None) -> set[int]:
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="invalid_admin_allowlist",
             ) from exc
-    return ids
+    return frozenset(ids)
+
+
+def _get_admin_allowlist() -> frozenset[int]:
+    return _parse_admin_allowlist(env_str("ADMIN_ALLOWLIST"))
 
 
 async def get_admin_token(
     x_admin_token: str | None = Header(default=None, alias="X-Admin-Token"),
     x_admin_user_id: str | None = Header(default=None, alias="X-Admin-User-Id"),
 ) -> dict:
-    expected = os.getenv("ADMIN_SERVICE_TOKEN") or os.getenv("SERVICE_TOKEN")
-    if not expected or x_admin_token != expected:
+    expected = _get_admin_service_token()
+    if not _token_matches(x_admin_token, expected):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="invalid_admin_token")
-    await _rate_limit_token(expected, 60)
-    allowlist = _parse_admin_allowlist(os.getenv("ADMIN_ALLOWLIST"))
+    await _rate_limit_by_key(_token_rate_limit_key(expected), 60)
+    allowlist = _get_admin_allowlist()
     if allowlist:
         if not x_admin_user_id:
             raise HTTPException(
@@ -0,0 +1,18 @@
+import os
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def env_str(name: str, default: str | None = None) -> str | None:
+    return os.getenv(name, default)
+
+
+@lru_cache(maxsize=None)
+def env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value else default
+
+
+def clear_env_cache() -> None:
+    env_str.cache_clear()
+    env_int.cache_clear()
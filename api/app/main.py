@@ -1,15 +1,17 @@
 import logging
 import os
-import uuid
 
 from fastapi import APIRouter, FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from starlette.responses import Response
 
 from app.dependencies import BannedUserError
+from app.env_cache import env_str
 from app.logging_utils import configure_logging
+from app.middleware import AuthASGIMiddleware, DBSessionMiddleware
+from app.telegram import close_telegram_client
 
-from app.db.engine import init_db
+from app.db import init_db
 from app.routes import (
     admin,
     ads,
@@ -24,9 +26,33 @@ from app.routes import (
     watch,
 )
 
+_ROUTE_MODULES = (
+    health,
+    auth,
+    catalog,
+    titles,
+    favorites,
+    watch,
+    ads,
+    subscriptions,
+    referral,
+    internal,
+    admin,
+)
+
 configure_logging(service="api")
 logger = logging.getLogger("kina.api")
 
+_REQUEST_ID_BATCH = 64
+_request_id_pool: list[bytes] = []
+
+
+def _new_request_id() -> str:
+    if not _request_id_pool:
+        raw = os.urandom(16 * _REQUEST_ID_BATCH)
+        _request_id_pool.extend(raw[i : i + 16] for i in range(0, len(raw), 16))
+    return _request_id_pool.pop().hex()
+
 
 def create_app() -> FastAPI:
     app = FastAPI(
@@ -34,19 +60,24 @@ def create_app() -> FastAPI:
         docs_url="/api/docs",
         openapi_url="/api/openapi.json",
         redoc_url=None,
+        default_response_class=ORJSONResponse,
     )
+    app.add_middleware(DBSessionMiddleware)
+    app.add_middleware(AuthASGIMiddleware)
 
     @app.middleware("http")
     async def request_id_middleware(request: Request, call_next) -> Response:
-        request_id = str(uuid.uuid4())
+        request_id = _new_request_id()
         request.state.request_id = request_id
         response = await call_next(request)
         response.headers["X-Request-Id"] = request_id
-        tg_user_id = getattr(request.state, "tg_user_id", None)
+        if not logger.isEnabledFor(logging.INFO):
+            return response
+        path = request.url.path
         if (
-            os.getenv("AUTH_UNAUTHORIZED_DEBUG", "0") == "1"
-            and response.status_code == 401
-            and request.url.path.startswith("/api")
+            response.status_code == 401
+            and path.startswith("/api")
+            and env_str("AUTH_UNAUTHORIZED_DEBUG", "0") == "1"
         ):
             logger.info(
                 "unauthorized request",
@@ -54,7 +85,7 @@ def create_app() -> FastAPI:
                     "action": "unauthorized_debug",
                     "request_id": request_id,
                     "method": request.method,
-                    "path": request.url.path,
+                    "path": path,
                     "has_x_init_data": "x-init-data" in request.headers,
                     "has_authorization": "authorization" in request.headers,
                     "has_cookie": "cookie" in request.headers,
@@ -65,9 +96,9 @@ def create_app() -> FastAPI:
             extra={
                 "action": "request",
                 "request_id": request_id,
-                "tg_user_id": tg_user_id,
+                "tg_user_id": getattr(request.state, "tg_user_id", None),
                 "method": request.method,
-                "path": request.url.path,
+                "path": path,
                 "status_code": response.status_code,
             },
         )
@@ -82,17 +113,8 @@ def create_app() -> FastAPI:
     @api_router.get("")
     async def api_root() -> dict[str, object]:
         return {"ok": True, "docs": "/api/docs"}
-    api_router.include_router(health.router)
-    api_router.include_router(auth.router)
-    api_router.include_router(catalog.router)
-    api_router.include_router(titles.router)
-    api_router.include_router(favorites.router)
-    api_router.include_router(watch.router)
-    api_router.include_router(ads.router)
-    api_router.include_router(subscriptions.router)
-    api_router.include_router(referral.router)
-    api_router.include_router(internal.router)
-    api_router.include_router(admin.router)
+    for module in _ROUTE_MODULES:
+        api_router.include_router(module.router)
 
     app.include_router(api_router)
 
@@ -101,6 +123,10 @@ def create_app() -> FastAPI:
         await init_db()
         logger.info("started")
 
+    @app.on_event("shutdown")
+    async def shutdown() -> None:
+        await close_telegram_client()
+
     return app
 
 
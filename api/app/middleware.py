@@ -0,0 +1,42 @@
+from fastapi import HTTPException
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.db.session import _request_session
+from app.dependencies import _authenticate_bearer
+
+
+class DBSessionMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = _request_session.set(None)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            session = _request_session.get()
+            _request_session.reset(token)
+            if session is not None:
+                await session.close()
+
+
+class AuthASGIMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            for name, value in scope["headers"]:
+                if name != b"authorization":
+                    continue
+                if value:
+                    state = scope.setdefault("state", {})
+                    try:
+                        state["auth"] = _authenticate_bearer(value.decode("latin-1"))
+                    except HTTPException as exc:
+                        state["auth_error"] = (exc.status_code, exc.detail)
+                break
+        await self.app(scope, receive, send)
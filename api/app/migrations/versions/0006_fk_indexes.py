@@ -0,0 +1,54 @@
+"""index foreign key columns
+
+Revision ID: 0006_fk_indexes
+Revises: 0005_drop_upload_jobs
+Create Date: 2026-10-16 00:00:00.000000
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0006_fk_indexes"
+down_revision = "0005_drop_upload_jobs"
+branch_labels = None
+depends_on = None
+
+
+FK_INDEXES = (
+    ("ix_episodes_title_id", "episodes", ["title_id"]),
+    ("ix_media_variants_audio_id", "media_variants", ["audio_id"]),
+    ("ix_media_variants_quality_id", "media_variants", ["quality_id"]),
+    ("ix_favorites_title_id", "favorites", ["title_id"]),
+    ("ix_subscriptions_title_id", "subscriptions", ["title_id"]),
+    ("ix_view_events_user_id", "view_events", ["user_id"]),
+    ("ix_view_events_episode_id", "view_events", ["episode_id"]),
+    ("ix_view_events_variant_id", "view_events", ["variant_id"]),
+    ("ix_payments_user_id", "payments", ["user_id"]),
+    ("ix_payments_plan_id", "payments", ["plan_id"]),
+    ("ix_referral_rewards_referrer_user_id", "referral_rewards", ["referrer_user_id"]),
+    ("ix_referral_rewards_referred_user_id", "referral_rewards", ["referred_user_id"]),
+)
+
+
+def upgrade() -> None:
+    for name, table, columns in FK_INDEXES:
+        with op.get_context().autocommit_block():
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(FK_INDEXES):
+        with op.get_context().autocommit_block():
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,38 @@
+"""brin index for audit events created_at
+
+Revision ID: 0007_audit_events_created_at
+Revises: 0006_fk_indexes
+Create Date: 2026-10-16 00:00:10.000000
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0007_audit_events_created_at"
+down_revision = "0006_fk_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_audit_events_created_at_brin",
+            "audit_events",
+            ["created_at"],
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_audit_events_created_at_brin",
+            table_name="audit_events",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
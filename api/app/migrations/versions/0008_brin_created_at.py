@@ -0,0 +1,60 @@
+"""use brin indexes for append-only created_at columns
+
+Revision ID: 0008_brin_created_at
+Revises: 0007_audit_events_created_at
+Create Date: 2026-10-16 00:00:20.000000
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0008_brin_created_at"
+down_revision = "0007_audit_events_created_at"
+branch_labels = None
+depends_on = None
+
+
+BRIN_INDEXES = (
+    ("view_events", "ix_view_events_created_at", "ix_view_events_created_at_brin"),
+)
+
+
+def upgrade() -> None:
+    for table, btree_name, brin_name in BRIN_INDEXES:
+        with op.get_context().autocommit_block():
+            op.create_index(
+                brin_name,
+                table,
+                ["created_at"],
+                postgresql_using="brin",
+                postgresql_with={"pages_per_range": 32},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        with op.get_context().autocommit_block():
+            op.drop_index(
+                btree_name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade() -> None:
+    for table, btree_name, brin_name in reversed(BRIN_INDEXES):
+        with op.get_context().autocommit_block():
+            op.create_index(
+                btree_name,
+                table,
+                ["created_at"],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        with op.get_context().autocommit_block():
+            op.drop_index(
+                brin_name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
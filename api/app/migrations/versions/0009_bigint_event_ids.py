@@ -0,0 +1,31 @@
+"""widen high-volume ids to bigint
+
+Revision ID: 0009_bigint_event_ids
+Revises: 0008_brin_created_at
+Create Date: 2026-10-16 00:00:30.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0009_bigint_event_ids"
+down_revision = "0008_brin_created_at"
+branch_labels = None
+depends_on = None
+
+
+TABLES = ("view_events", "audit_events", "payments")
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.alter_column(table, "id", type_=sa.BigInteger(), existing_type=sa.Integer())
+        op.execute(sa.text(f"ALTER SEQUENCE {table}_id_seq AS bigint"))
+
+
+def downgrade() -> None:
+    for table in reversed(TABLES):
+        op.execute(sa.text(f"ALTER SEQUENCE {table}_id_seq AS integer"))
+        op.alter_column(table, "id", type_=sa.Integer(), existing_type=sa.BigInteger())
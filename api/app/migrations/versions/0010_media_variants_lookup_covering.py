@@ -0,0 +1,37 @@
+"""covering index for media variant lookups
+
+Revision ID: 0010_media_variants_lookup_covering
+Revises: 0009_bigint_event_ids
+Create Date: 2026-10-16 00:00:40.000000
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0010_media_variants_lookup_covering"
+down_revision = "0009_bigint_event_ids"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_media_variants_lookup_covering",
+            "media_variants",
+            ["title_id", "episode_id", "audio_id", "quality_id"],
+            postgresql_include=["id", "telegram_file_id", "status"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_media_variants_lookup_covering",
+            table_name="media_variants",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
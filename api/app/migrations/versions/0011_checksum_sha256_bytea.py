@@ -0,0 +1,48 @@
+"""store media variant checksums as bytea
+
+Revision ID: 0011_checksum_sha256_bytea
+Revises: 0010_media_variants_lookup_covering
+Create Date: 2026-10-16 00:00:50.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0011_checksum_sha256_bytea"
+down_revision = "0010_media_variants_lookup_covering"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    invalid_count = op.get_bind().execute(
+        sa.text(
+            "SELECT count(*) FROM media_variants "
+            "WHERE checksum_sha256 IS NOT NULL "
+            "AND checksum_sha256 !~ '^[0-9A-Fa-f]{64}$'"
+        )
+    ).scalar_one()
+    if invalid_count:
+        raise RuntimeError(
+            f"media_variants has {invalid_count} checksum_sha256 values that are not "
+            "64 hex characters; fix or clear them before running this migration"
+        )
+    op.alter_column(
+        "media_variants",
+        "checksum_sha256",
+        type_=sa.LargeBinary(),
+        existing_type=sa.String(length=64),
+        postgresql_using="decode(checksum_sha256, 'hex')",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "media_variants",
+        "checksum_sha256",
+        type_=sa.String(length=64),
+        existing_type=sa.LargeBinary(),
+        postgresql_using="encode(checksum_sha256, 'hex')",
+    )
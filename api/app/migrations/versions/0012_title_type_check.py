@@ -0,0 +1,42 @@
+"""replace title_type enum with text and a check constraint
+
+Revision ID: 0012_title_type_check
+Revises: 0011_checksum_sha256_bytea
+Create Date: 2026-10-16 00:01:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0012_title_type_check"
+down_revision = "0011_checksum_sha256_bytea"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "titles",
+        "type",
+        type_=sa.String(length=20),
+        existing_type=sa.Enum("movie", "series", name="title_type"),
+        existing_nullable=False,
+        postgresql_using="type::text",
+    )
+    op.execute(sa.text("DROP TYPE IF EXISTS title_type"))
+    op.create_check_constraint("ck_titles_type", "titles", "type IN ('movie', 'series')")
+
+
+def downgrade() -> None:
+    op.drop_constraint("ck_titles_type", "titles", type_="check")
+    op.execute(sa.text("CREATE TYPE title_type AS ENUM ('movie', 'series')"))
+    op.alter_column(
+        "titles",
+        "type",
+        type_=sa.Enum("movie", "series", name="title_type", create_type=False),
+        existing_type=sa.String(length=20),
+        existing_nullable=False,
+        postgresql_using="type::title_type",
+    )
@@ -0,0 +1,37 @@
+"""covering index for referrals by referrer
+
+Revision ID: 0013_referrals_referrer_referred
+Revises: 0012_title_type_check
+Create Date: 2026-10-16 00:01:10.000000
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0013_referrals_referrer_referred"
+down_revision = "0012_title_type_check"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_referrals_referrer_referred",
+            "referrals",
+            ["referrer_user_id", "referred_user_id"],
+            postgresql_include=["created_at"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_referrals_referrer_referred",
+            table_name="referrals",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
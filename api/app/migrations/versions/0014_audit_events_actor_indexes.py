@@ -0,0 +1,46 @@
+"""index audit event actor foreign keys
+
+Revision ID: 0014_audit_events_actor_indexes
+Revises: 0013_referrals_referrer_referred
+Create Date: 2026-10-16 00:01:20.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0014_audit_events_actor_indexes"
+down_revision = "0013_referrals_referrer_referred"
+branch_labels = None
+depends_on = None
+
+
+ACTOR_INDEXES = (
+    ("ix_audit_events_actor_user_id", "actor_user_id"),
+    ("ix_audit_events_actor_admin_id", "actor_admin_id"),
+)
+
+
+def upgrade() -> None:
+    for name, column in ACTOR_INDEXES:
+        with op.get_context().autocommit_block():
+            op.create_index(
+                name,
+                "audit_events",
+                [column],
+                postgresql_where=sa.text(f"{column} IS NOT NULL"),
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    for name, _ in reversed(ACTOR_INDEXES):
+        with op.get_context().autocommit_block():
+            op.drop_index(
+                name,
+                table_name="audit_events",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
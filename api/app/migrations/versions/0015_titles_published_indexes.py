@@ -0,0 +1,46 @@
+"""partial indexes for the published catalog
+
+Revision ID: 0015_titles_published_indexes
+Revises: 0014_audit_events_actor_indexes
+Create Date: 2026-10-16 00:01:30.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0015_titles_published_indexes"
+down_revision = "0014_audit_events_actor_indexes"
+branch_labels = None
+depends_on = None
+
+
+PUBLISHED_INDEXES = (
+    ("ix_titles_published_created", ["created_at"]),
+    ("ix_titles_type_published_created", ["type", "created_at"]),
+)
+
+
+def upgrade() -> None:
+    for name, columns in PUBLISHED_INDEXES:
+        with op.get_context().autocommit_block():
+            op.create_index(
+                name,
+                "titles",
+                columns,
+                postgresql_where=sa.text("is_published IS TRUE"),
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    for name, _ in reversed(PUBLISHED_INDEXES):
+        with op.get_context().autocommit_block():
+            op.drop_index(
+                name,
+                table_name="titles",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
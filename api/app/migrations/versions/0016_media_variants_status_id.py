@@ -0,0 +1,51 @@
+"""index media variants by status then id
+
+Revision ID: 0016_media_variants_status_id
+Revises: 0015_titles_published_indexes
+Create Date: 2026-10-16 00:01:40.000000
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0016_media_variants_status_id"
+down_revision = "0015_titles_published_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_media_variants_status_id",
+            "media_variants",
+            ["status", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_media_variants_status",
+            table_name="media_variants",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_media_variants_status",
+            "media_variants",
+            ["status"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_media_variants_status_id",
+            table_name="media_variants",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,48 @@
+"""store plan prices and payment amounts in minor units
+
+Revision ID: 0017_money_minor_units
+Revises: 0016_media_variants_status_id
+Create Date: 2026-10-16 00:01:50.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0017_money_minor_units"
+down_revision = "0016_media_variants_status_id"
+branch_labels = None
+depends_on = None
+
+
+MONEY_COLUMNS = (
+    ("premium_plans", "price", "price_minor", True),
+    ("payments", "amount", "amount_minor", False),
+)
+
+
+def upgrade() -> None:
+    for table, column, minor_column, nullable in MONEY_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            new_column_name=minor_column,
+            type_=sa.BigInteger(),
+            existing_type=sa.Numeric(10, 2),
+            existing_nullable=nullable,
+            postgresql_using=f"round({column} * 100)::bigint",
+        )
+
+
+def downgrade() -> None:
+    for table, column, minor_column, nullable in reversed(MONEY_COLUMNS):
+        op.alter_column(
+            table,
+            minor_column,
+            new_column_name=column,
+            type_=sa.Numeric(10, 2),
+            existing_type=sa.BigInteger(),
+            existing_nullable=nullable,
+            postgresql_using=f"({minor_column} / 100.0)::numeric(10, 2)",
+        )
@@ -1,3 +1,5 @@
+from sqlalchemy.orm import configure_mappers
+
 from app.models.models import (
     Admin,
     AuditEvent,
@@ -21,6 +23,8 @@ from app.models.models import (
     ViewEvent,
 )
 
+configure_mappers()
+
 __all__ = [
     "Admin",
     "AuditEvent",
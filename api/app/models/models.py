@@ -3,13 +3,13 @@ import enum
 from sqlalchemy import (
     BigInteger,
     Boolean,
+    CheckConstraint,
     Date,
     DateTime,
-    Enum,
     ForeignKey,
     Index,
     Integer,
-    Numeric,
+    LargeBinary,
     String,
     Text,
     UniqueConstraint,
@@ -22,7 +22,7 @@ from sqlalchemy.orm import Mapped, mapped_column
 from app.db.base import Base
 
 
-class TitleType(enum.Enum):
+class TitleType(enum.StrEnum):
     MOVIE = "movie"
     SERIES = "series"
 
@@ -64,16 +64,23 @@ class UserState(Base):
 
 class Title(Base):
     __tablename__ = "titles"
-
-    id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    type: Mapped[TitleType] = mapped_column(
-        Enum(
-            TitleType,
-            name="title_type",
-            values_callable=lambda enum_cls: [e.value for e in enum_cls],
+    __table_args__ = (
+        Index(
+            "ix_titles_published_created",
+            "created_at",
+            postgresql_where=text("is_published IS TRUE"),
         ),
-        nullable=False,
+        Index(
+            "ix_titles_type_published_created",
+            "type",
+            "created_at",
+            postgresql_where=text("is_published IS TRUE"),
+        ),
+        CheckConstraint("type IN ('movie', 'series')", name="ck_titles_type"),
     )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    type: Mapped[str] = mapped_column(String(20), nullable=False)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     original_name: Mapped[str | None] = mapped_column(String(255))
     description: Mapped[str | None] = mapped_column(Text)
@@ -108,6 +115,7 @@ class Episode(Base):
     __table_args__ = (
         UniqueConstraint("season_id", "episode_number", name="uq_episodes_season_episode"),
         Index("ix_episodes_published_at", "published_at"),
+        Index("ix_episodes_title_id", "title_id"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
@@ -160,8 +168,19 @@ class MediaVariant(Base):
             unique=True,
             postgresql_where=text("episode_id IS NOT NULL"),
         ),
-        Index("ix_media_variants_status", "status"),
+        Index("ix_media_variants_status_id", "status", "id"),
+        Index(
+            "ix_media_variants_lookup_covering",
+            "title_id",
+            "episode_id",
+            "audio_id",
+            "quality_id",
+            postgresql_include=["id", "telegram_file_id", "status"],
+        ),
+        Index("ix_media_variants_audio_id", "audio_id"),
+        Index("ix_media_variants_quality_id", "quality_id"),
     )
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     title_id: Mapped[int] = mapped_column(ForeignKey("titles.id", ondelete="CASCADE"))
@@ -175,7 +194,7 @@ class MediaVariant(Base):
     error: Mapped[str | None] = mapped_column(Text)
     duration_sec: Mapped[int | None] = mapped_column(Integer)
     size_bytes: Mapped[int | None] = mapped_column(BigInteger)
-    checksum_sha256: Mapped[str | None] = mapped_column(String(64))
+    checksum_sha256: Mapped[bytes | None] = mapped_column(LargeBinary(32))
     created_at: Mapped[DateTime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
@@ -186,6 +205,7 @@ class MediaVariant(Base):
 
 class Favorite(Base):
     __tablename__ = "favorites"
+    __table_args__ = (Index("ix_favorites_title_id", "title_id"),)
 
     user_id: Mapped[int] = mapped_column(
         ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
@@ -200,6 +220,7 @@ class Favorite(Base):
 
 class Subscription(Base):
     __tablename__ = "subscriptions"
+    __table_args__ = (Index("ix_subscriptions_title_id", "title_id"),)
 
     user_id: Mapped[int] = mapped_column(
         ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
@@ -219,11 +240,19 @@ class Subscription(Base):
 class ViewEvent(Base):
     __tablename__ = "view_events"
     __table_args__ = (
-        Index("ix_view_events_created_at", "created_at"),
+        Index(
+            "ix_view_events_created_at_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
         Index("ix_view_events_title_created", "title_id", "created_at"),
+        Index("ix_view_events_user_id", "user_id"),
+        Index("ix_view_events_episode_id", "episode_id"),
+        Index("ix_view_events_variant_id", "variant_id"),
     )
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
     title_id: Mapped[int] = mapped_column(ForeignKey("titles.id", ondelete="CASCADE"))
     episode_id: Mapped[int | None] = mapped_column(ForeignKey("episodes.id"))
@@ -239,7 +268,7 @@ class PremiumPlan(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     months: Mapped[int] = mapped_column(Integer, nullable=False)
-    price: Mapped[float | None] = mapped_column(Numeric(10, 2))
+    price_minor: Mapped[int | None] = mapped_column(BigInteger)
     currency: Mapped[str | None] = mapped_column(String(10))
     is_active: Mapped[bool] = mapped_column(Boolean, server_default="true", nullable=False)
 
@@ -258,13 +287,17 @@ class UserPremium(Base):
 
 class Payment(Base):
     __tablename__ = "payments"
+    __table_args__ = (
+        Index("ix_payments_user_id", "user_id"),
+        Index("ix_payments_plan_id", "plan_id"),
+    )
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
     provider: Mapped[str] = mapped_column(String(100), nullable=False)
     provider_payment_id: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
     plan_id: Mapped[int] = mapped_column(ForeignKey("premium_plans.id"), nullable=False)
-    amount: Mapped[float] = mapped_column(Numeric(10, 2), nullable=False)
+    amount_minor: Mapped[int] = mapped_column(BigInteger, nullable=False)
     currency: Mapped[str] = mapped_column(String(10), nullable=False)
     status: Mapped[str] = mapped_column(String(50), nullable=False)
     created_at: Mapped[DateTime] = mapped_column(
@@ -287,6 +320,14 @@ class ReferralCode(Base):
 
 class Referral(Base):
     __tablename__ = "referrals"
+    __table_args__ = (
+        Index(
+            "ix_referrals_referrer_referred",
+            "referrer_user_id",
+            "referred_user_id",
+            postgresql_include=["created_at"],
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     referrer_user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
@@ -300,6 +341,10 @@ class Referral(Base):
 
 class ReferralReward(Base):
     __tablename__ = "referral_rewards"
+    __table_args__ = (
+        Index("ix_referral_rewards_referrer_user_id", "referrer_user_id"),
+        Index("ix_referral_rewards_referred_user_id", "referred_user_id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     referrer_user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
@@ -327,8 +372,26 @@ class Admin(Base):
 
 class AuditEvent(Base):
     __tablename__ = "audit_events"
+    __table_args__ = (
+        Index(
+            "ix_audit_events_created_at_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        Index(
+            "ix_audit_events_actor_user_id",
+            "actor_user_id",
+            postgresql_where=text("actor_user_id IS NOT NULL"),
+        ),
+        Index(
+            "ix_audit_events_actor_admin_id",
+            "actor_admin_id",
+            postgresql_where=text("actor_admin_id IS NOT NULL"),
+        ),
+    )
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
     created_at: Mapped[DateTime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
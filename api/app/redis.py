@@ -1,17 +1,36 @@
-import json
 import os
+import socket
 from typing import Any
 
-from redis.asyncio import Redis
+import orjson
+from redis.asyncio import BlockingConnectionPool, Redis
+from redis.commands.core import AsyncScript
+
+from app.settings import get_settings
 
 _redis_client: Redis | None = None
+_setnx_and_json_set_script: AsyncScript | None = None
 
 
 def get_redis() -> Redis:
     global _redis_client
     if _redis_client is None:
         redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
-        _redis_client = Redis.from_url(redis_url, decode_responses=True)
+        keepalive_options = (
+            {socket.TCP_KEEPIDLE: 60} if hasattr(socket, "TCP_KEEPIDLE") else None
+        )
+        settings = get_settings()
+        pool = BlockingConnectionPool.from_url(
+            redis_url,
+            decode_responses=True,
+            max_connections=settings.redis_max_connections,
+            timeout=settings.redis_pool_timeout,
+            socket_keepalive=True,
+            socket_keepalive_options=keepalive_options,
+            health_check_interval=30,
+            retry_on_timeout=True,
+        )
+        _redis_client = Redis.from_pool(pool)
     return _redis_client
 
 
@@ -23,5 +42,31 @@ async def setnx_with_ttl(key: str, ttl: int) -> bool:
 
 async def json_set(key: str, ttl: int, obj: Any) -> None:
     redis = get_redis()
-    payload = json.dumps(obj, ensure_ascii=False)
+    payload = orjson.dumps(obj)
     await redis.set(key, payload, ex=ttl)
+
+
+_SETNX_AND_JSON_SET = """
+if redis.call("SET", KEYS[1], "1", "NX", "EX", ARGV[1]) then
+    redis.call("SET", KEYS[2], ARGV[3], "EX", ARGV[2])
+    return {1, 0}
+end
+return {0, redis.call("TTL", KEYS[1])}
+"""
+
+
+def _get_setnx_and_json_set_script() -> AsyncScript:
+    global _setnx_and_json_set_script
+    if _setnx_and_json_set_script is None:
+        _setnx_and_json_set_script = get_redis().register_script(_SETNX_AND_JSON_SET)
+    return _setnx_and_json_set_script
+
+
+async def setnx_and_json_set(
+    lock_key: str, lock_ttl: int, data_key: str, data_ttl: int, obj: Any
+) -> tuple[bool, int]:
+    script = _get_setnx_and_json_set_script()
+    acquired, lock_remaining = await script(
+        keys=[lock_key, data_key], args=[lock_ttl, data_ttl, orjson.dumps(obj)]
+    )
+    return bool(acquired), lock_remaining
@@ -1,40 +1,38 @@
-import asyncio
 import json
 import logging
-import os
-import uuid
-import urllib.error
-import urllib.request
+import secrets
 from datetime import date, datetime, timezone
+from functools import lru_cache
+from typing import Any, AsyncIterator
 
 from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, UploadFile, status
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field, validator
-from sqlalchemy import delete, func, or_, select
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import BaseModel, Field, field_validator
+from sqlalchemy import Row, Select, and_, delete, func, literal, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.dependencies import get_admin_token, get_db_session
+from app.env_cache import env_str
 from app.models import (
     AudioTrack,
     Episode,
-    Favorite,
     MediaVariant,
     Quality,
     Referral,
     ReferralReward,
     Season,
-    Subscription,
     Title,
     TitleType,
     User,
     UserPremium,
-    ViewEvent,
 )
 from app.services.audit import log_audit_event
 from app.services.premium import apply_premium_days
+from app.telegram import get_telegram_client
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 logger = logging.getLogger("kina.api.admin")
+_UPLOAD_CHUNK_SIZE = 1024 * 1024
 
 
 async def _log_admin_event(
@@ -124,6 +122,23 @@ class QualityUpdate(BaseModel):
     is_active: bool | None = None
 
 
+def _normalize_checksum_hex(value: str | None) -> str | None:
+    if value is None:
+        return None
+    value = value.strip().lower()
+    if len(value) != 64:
+        raise ValueError("checksum_sha256 must be 64 hex characters")
+    try:
+        bytes.fromhex(value)
+    except ValueError:
+        raise ValueError("checksum_sha256 must be 64 hex characters") from None
+    return value
+
+
+def _checksum_bytes(value: str | None) -> bytes | None:
+    return bytes.fromhex(value) if value is not None else None
+
+
 class VariantCreate(BaseModel):
     title_id: int
     episode_id: int | None = None
@@ -138,6 +153,11 @@ class VariantCreate(BaseModel):
     size_bytes: int | None = None
     checksum_sha256: str | None = None
 
+    @field_validator("checksum_sha256")
+    @classmethod
+    def checksum_sha256_hex(cls, value: str | None) -> str | None:
+        return _normalize_checksum_hex(value)
+
 
 class VariantUpdate(BaseModel):
     title_id: int | None = None
@@ -153,6 +173,11 @@ class VariantUpdate(BaseModel):
     size_bytes: int | None = None
     checksum_sha256: str | None = None
 
+    @field_validator("checksum_sha256")
+    @classmethod
+    def checksum_sha256_hex(cls, value: str | None) -> str | None:
+        return _normalize_checksum_hex(value)
+
 
 class VariantAttachFile(BaseModel):
     title_id: int
@@ -163,7 +188,8 @@ class VariantAttachFile(BaseModel):
     storage_message_id: int | None = None
     storage_chat_id: int | None = None
 
-    @validator("telegram_file_id")
+    @field_validator("telegram_file_id")
+    @classmethod
     def telegram_file_id_not_empty(cls, value: str) -> str:
         if not value.strip():
             raise ValueError("telegram_file_id must not be empty")
@@ -191,24 +217,31 @@ class UserBanRequest(BaseModel):
     reason: str = Field(..., min_length=1, max_length=255)
 
 
-def _expected_filename(title_id: int, episode_id: int | None, audio_id: int, quality_id: int) -> str:
-    if episode_id is None:
-        return f"title_{title_id}__a_{audio_id}__q_{quality_id}.mp4"
-    return f"ep_{episode_id}__a_{audio_id}__q_{quality_id}.mp4"
+_TITLE_FILENAME_FORMAT = "title_%d__a_%d__q_%d.mp4"
+_EPISODE_FILENAME_FORMAT = "ep_%d__a_%d__q_%d.mp4"
+
+
+async def _row_exists(session: AsyncSession, model: Any, row_id: int) -> bool:
+    result = await session.execute(select(literal(1)).where(model.id == row_id))
+    return result.first() is not None
+
+
+async def _episode_title_id(session: AsyncSession, episode_id: int) -> int:
+    result = await session.execute(select(Episode.title_id).where(Episode.id == episode_id))
+    episode_title_id = result.scalar_one_or_none()
+    if episode_title_id is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="episode_not_found")
+    return episode_title_id
 
 
 async def _validate_title_episode(
     session: AsyncSession, title_id: int, episode_id: int | None
 ) -> None:
-    title = await session.get(Title, title_id)
-    if not title:
+    if not await _row_exists(session, Title, title_id):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="title_not_found")
     if episode_id is None:
         return
-    episode = await session.get(Episode, episode_id)
-    if not episode:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="episode_not_found")
-    if episode.title_id != title_id:
+    if await _episode_title_id(session, episode_id) != title_id:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="episode_title_mismatch")
 
 
@@ -223,58 +256,78 @@ def _parse_optional_int(value: str | None) -> int | None:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="invalid_integer") from exc
 
 
-def _encode_multipart_form(fields: dict[str, str], files: dict[str, tuple[str, str, bytes]]) -> tuple[bytes, str]:
-    boundary = f"kina-{uuid.uuid4().hex}"
-    body = bytearray()
-    for name, value in fields.items():
-        body.extend(f"--{boundary}\r\n".encode())
-        body.extend(f'Content-Disposition: form-data; name="{name}"\r\n\r\n'.encode())
-        body.extend(value.encode())
-        body.extend(b"\r\n")
-    for name, (filename, content_type, file_bytes) in files.items():
-        body.extend(f"--{boundary}\r\n".encode())
-        body.extend(
-            f'Content-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'.encode()
-        )
-        body.extend(f"Content-Type: {content_type}\r\n\r\n".encode())
-        body.extend(file_bytes)
-        body.extend(b"\r\n")
-    body.extend(f"--{boundary}--\r\n".encode())
-    return bytes(body), f"multipart/form-data; boundary={boundary}"
+@lru_cache(maxsize=8)
+def _telegram_method_url(bot_token: str, method: str) -> str:
+    return f"https://api.telegram.org/bot{bot_token}/{method}"
 
 
-def _send_telegram_request(
+def _quote_form_value(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\")
+        .replace('"', "%22")
+        .replace("\r", "%0D")
+        .replace("\n", "%0A")
+    )
+
+
+def _multipart_envelope(
+    boundary: str, fields: dict[str, str], file_field: str, filename: str, content_type: str
+) -> tuple[bytes, bytes]:
+    parts = [
+        f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'
+        for name, value in fields.items()
+    ]
+    parts.append(
+        f"--{boundary}\r\n"
+        f'Content-Disposition: form-data; name="{file_field}"; '
+        f'filename="{_quote_form_value(filename)}"\r\n'
+        f"Content-Type: {content_type}\r\n\r\n"
+    )
+    return "".join(parts).encode("utf-8"), f"\r\n--{boundary}--\r\n".encode("utf-8")
+
+
+async def _iter_multipart(head: bytes, upload: UploadFile, tail: bytes) -> AsyncIterator[bytes]:
+    yield head
+    while chunk := await upload.read(_UPLOAD_CHUNK_SIZE):
+        yield chunk
+    yield tail
+
+
+async def _send_telegram_request(
     method: str,
     bot_token: str,
     fields: dict[str, str],
     file_field: str,
-    file_payload: tuple[str, str, bytes],
+    file_payload: tuple[str, str, UploadFile],
 ) -> dict:
-    url = f"https://api.telegram.org/bot{bot_token}/{method}"
-    body, content_type = _encode_multipart_form(fields, {file_field: file_payload})
-    request = urllib.request.Request(url, data=body, headers={"Content-Type": content_type})
-    try:
-        with urllib.request.urlopen(request) as response:
-            raw = response.read()
-    except urllib.error.HTTPError as exc:
-        raw = exc.read()
+    url = _telegram_method_url(bot_token, method)
+    filename, content_type, upload = file_payload
+    await upload.seek(0)
+    boundary = secrets.token_hex(16)
+    head, tail = _multipart_envelope(boundary, fields, file_field, filename, content_type)
+    headers = {"Content-Type": f"multipart/form-data; boundary={boundary}"}
+    if upload.size is not None:
+        headers["Content-Length"] = str(len(head) + upload.size + len(tail))
+    response = await get_telegram_client().post(
+        url, content=_iter_multipart(head, upload, tail), headers=headers
+    )
     try:
-        payload = json.loads(raw.decode("utf-8"))
+        payload = response.json()
     except json.JSONDecodeError:
-        payload = {"ok": False, "description": raw.decode("utf-8", errors="ignore")}
+        payload = {"ok": False, "description": response.text}
     return payload
 
 
 async def _upload_to_telegram(
-    file_bytes: bytes,
+    upload: UploadFile,
     filename: str,
     content_type: str | None,
     caption: str | None,
 ) -> tuple[str, int, int]:
-    bot_token = os.getenv("BOT_TOKEN")
+    bot_token = env_str("BOT_TOKEN")
     if not bot_token:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="bot_token_missing")
-    storage_chat_id = os.getenv("TELEGRAM_STORAGE_CHAT_ID") or os.getenv("STORAGE_CHAT_ID")
+    storage_chat_id = env_str("TELEGRAM_STORAGE_CHAT_ID") or env_str("STORAGE_CHAT_ID")
     if not storage_chat_id:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="storage_chat_id_missing"
@@ -282,22 +335,20 @@ async def _upload_to_telegram(
     fields = {"chat_id": storage_chat_id}
     if caption:
         fields["caption"] = caption
-    payload = await asyncio.to_thread(
-        _send_telegram_request,
+    payload = await _send_telegram_request(
         "sendVideo",
         bot_token,
         fields,
         "video",
-        (filename, content_type or "application/octet-stream", file_bytes),
+        (filename, content_type or "application/octet-stream", upload),
     )
     if not payload.get("ok"):
-        payload = await asyncio.to_thread(
-            _send_telegram_request,
+        payload = await _send_telegram_request(
             "sendDocument",
             bot_token,
             fields,
             "document",
-            (filename, content_type or "application/octet-stream", file_bytes),
+            (filename, content_type or "application/octet-stream", upload),
         )
     if not payload.get("ok"):
         raise HTTPException(
@@ -382,7 +433,6 @@ async def _attach_variant_file_internal(
         },
     )
     await session.commit()
-    await session.refresh(variant)
     return VariantAttachFileResponse(
         variant_id=variant.id,
         status=variant.status,
@@ -392,6 +442,57 @@ async def _attach_variant_file_internal(
     )
 
 
+async def _update_row(
+    session: AsyncSession, model: Any, row_id: int, values: dict, not_found_detail: str
+) -> None:
+    if values:
+        statement = update(model).where(model.id == row_id).values(**values).returning(model.id)
+    else:
+        statement = select(model.id).where(model.id == row_id)
+    result = await session.execute(statement)
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=not_found_detail)
+
+
+_TITLE_COLUMNS = (
+    Title.id,
+    Title.type,
+    Title.name,
+    Title.original_name,
+    Title.description,
+    Title.year,
+    Title.poster_url,
+    Title.is_published,
+    Title.created_at,
+    Title.updated_at,
+)
+_AUDIO_TRACK_COLUMNS = (AudioTrack.id, AudioTrack.name, AudioTrack.code, AudioTrack.is_active)
+_QUALITY_COLUMNS = (Quality.id, Quality.name, Quality.height, Quality.is_active)
+
+
+def _rows_to_items(rows: list[Row], columns: tuple) -> list[dict]:
+    keys = [column.key for column in columns]
+    return [dict(zip(keys, row)) for row in rows]
+
+
+async def _fetch_page(
+    session: AsyncSession, query: Select, order_by: Any, limit: int, offset: int
+) -> tuple[list[Row], int]:
+    result = await session.execute(
+        query.add_columns(func.count().over().label("total"))
+        .order_by(order_by)
+        .limit(limit)
+        .offset(offset)
+    )
+    rows = result.all()
+    if rows:
+        return rows, rows[0].total
+    if offset == 0:
+        return [], 0
+    total_result = await session.execute(select(func.count()).select_from(query.subquery()))
+    return [], total_result.scalar_one()
+
+
 def _serialize_variant(variant: MediaVariant) -> dict:
     return {
         "id": variant.id,
@@ -406,11 +507,14 @@ def _serialize_variant(variant: MediaVariant) -> dict:
         "error": variant.error,
         "duration_sec": variant.duration_sec,
         "size_bytes": variant.size_bytes,
-        "checksum_sha256": variant.checksum_sha256,
+        "checksum_sha256": variant.checksum_sha256.hex() if variant.checksum_sha256 else None,
         "created_at": variant.created_at,
         "updated_at": variant.updated_at,
-        "expected_filename": _expected_filename(
-            variant.title_id, variant.episode_id, variant.audio_id, variant.quality_id
+        "expected_filename": (
+            _TITLE_FILENAME_FORMAT % (variant.title_id, variant.audio_id, variant.quality_id)
+            if variant.episode_id is None
+            else _EPISODE_FILENAME_FORMAT
+            % (variant.episode_id, variant.audio_id, variant.quality_id)
         ),
     }
 
@@ -423,36 +527,21 @@ async def list_titles(
     offset: int = Query(default=0, ge=0),
     _: dict = Depends(get_admin_token),
     session: AsyncSession = Depends(get_db_session),
-) -> dict:
-    query = select(Title)
+) -> ORJSONResponse:
+    query = select(*_TITLE_COLUMNS)
     if type:
         query = query.where(Title.type == type)
     if q:
         query = query.where(Title.name.ilike(f"%{q}%"))
-    total_result = await session.execute(select(func.count()).select_from(query.subquery()))
-    total = total_result.scalar_one()
-    result = await session.execute(query.order_by(Title.id.desc()).limit(limit).offset(offset))
-    titles = result.scalars().all()
-    return {
-        "items": [
-            {
-                "id": title.id,
-                "type": title.type.value,
-                "name": title.name,
-                "original_name": title.original_name,
-                "description": title.description,
-                "year": title.year,
-                "poster_url": title.poster_url,
-                "is_published": title.is_published,
-                "created_at": title.created_at,
-                "updated_at": title.updated_at,
-            }
-            for title in titles
-        ],
-        "total": total,
-        "limit": limit,
-        "offset": offset,
-    }
+    rows, total = await _fetch_page(session, query, Title.id.desc(), limit, offset)
+    return ORJSONResponse(
+        {
+            "items": _rows_to_items(rows, _TITLE_COLUMNS),
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+        }
+    )
 
 
 @router.post("/titles", status_code=status.HTTP_201_CREATED)
@@ -482,7 +571,6 @@ async def create_title(
         metadata={"name": title.name},
     )
     await session.commit()
-    await session.refresh(title)
     return {"id": title.id}
 
 
@@ -491,56 +579,49 @@ async def get_title(
     title_id: int,
     _: dict = Depends(get_admin_token),
     session: AsyncSession = Depends(get_db_session),
-) -> dict:
-    title = await session.get(Title, title_id)
-    if not title:
+) -> ORJSONResponse:
+    title_result = await session.execute(select(*_TITLE_COLUMNS).where(Title.id == title_id))
+    title = title_result.first()
+    if title is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="title_not_found")
-    seasons_result = await session.execute(
-        select(Season).where(Season.title_id == title_id).order_by(Season.season_number)
-    )
-    seasons = seasons_result.scalars().all()
-    episodes_result = await session.execute(
-        select(Episode)
-        .where(Episode.title_id == title_id)
-        .order_by(Episode.season_id, Episode.episode_number)
+    rows = await session.execute(
+        select(Season, Episode)
+        .outerjoin(
+            Episode,
+            and_(Episode.season_id == Season.id, Episode.title_id == Season.title_id),
+        )
+        .where(Season.title_id == title_id)
+        .order_by(Season.season_number, Episode.episode_number)
     )
-    episodes = episodes_result.scalars().all()
-    episodes_by_season: dict[int, list[Episode]] = {}
-    for episode in episodes:
-        episodes_by_season.setdefault(episode.season_id, []).append(episode)
-    return {
-        "id": title.id,
-        "type": title.type.value,
-        "name": title.name,
-        "original_name": title.original_name,
-        "description": title.description,
-        "year": title.year,
-        "poster_url": title.poster_url,
-        "is_published": title.is_published,
-        "created_at": title.created_at,
-        "updated_at": title.updated_at,
-        "seasons": [
-            {
-                "id": season.id,
-                "season_number": season.season_number,
-                "name": season.name,
-                "created_at": season.created_at,
-                "episodes": [
-                    {
-                        "id": episode.id,
-                        "episode_number": episode.episode_number,
-                        "name": episode.name,
-                        "description": episode.description,
-                        "air_date": episode.air_date,
-                        "published_at": episode.published_at,
-                        "created_at": episode.created_at,
-                    }
-                    for episode in episodes_by_season.get(season.id, [])
-                ],
-            }
-            for season in seasons
-        ],
-    }
+    seasons: list[dict] = []
+    current_season_id = None
+    for season, episode in rows:
+        if season.id != current_season_id:
+            current_season_id = season.id
+            seasons.append(
+                {
+                    "id": season.id,
+                    "season_number": season.season_number,
+                    "name": season.name,
+                    "created_at": season.created_at,
+                    "episodes": [],
+                }
+            )
+        if episode is not None:
+            seasons[-1]["episodes"].append(
+                {
+                    "id": episode.id,
+                    "episode_number": episode.episode_number,
+                    "name": episode.name,
+                    "description": episode.description,
+                    "air_date": episode.air_date,
+                    "published_at": episode.published_at,
+                    "created_at": episode.created_at,
+                }
+            )
+    item = title._asdict()
+    item["seasons"] = seasons
+    return ORJSONResponse(item)
 
 
 @router.patch("/titles/{title_id}")
@@ -550,23 +631,18 @@ async def update_title(
     admin_info: dict = Depends(get_admin_token),
     session: AsyncSession = Depends(get_db_session),
 ) -> dict:
-    title = await session.get(Title, title_id)
-    if not title:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="title_not_found")
     update_data = payload.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(title, key, value)
+    await _update_row(session, Title, title_id, update_data, "title_not_found")
     await _log_admin_event(
         session,
         admin_info,
         action="title_updated",
         entity_type="title",
-        entity_id=title.id,
+        entity_id=title_id,
         metadata={"fields": list(update_data.keys())},
     )
     await session.commit()
-    await session.refresh(title)
-    return {"id": title.id}
+    return {"id": title_id}
 
 
 @router.delete("/titles/{title_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -575,24 +651,19 @@ async def delete_title(
     admin_info: dict = Depends(get_admin_token),
     session: AsyncSession = Depends(get_db_session),
 ) -> None:
-    title = await session.get(Title, title_id)
-    if not title:
+    result = await session.execute(
+        delete(Title).where(Title.id == title_id).returning(Title.name)
+    )
+    title_name = result.scalar_one_or_none()
+    if title_name is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="title_not_found")
-    await session.execute(delete(ViewEvent).where(ViewEvent.title_id == title_id))
-    await session.execute(delete(Favorite).where(Favorite.title_id == title_id))
-    await session.execute(delete(Subscription).where(Subscription.title_id == title_id))
-    variant_ids = select(MediaVariant.id).where(MediaVariant.title_id == title_id)
-    await session.execute(delete(MediaVariant).where(MediaVariant.title_id == title_id))
-    await session.execute(delete(Episode).where(Episode.title_id == title_id))
-    await session.execute(delete(Season).where(Season.title_id == title_id))
-    await session.delete(title)
     await _log_admin_event(
         session,
         admin_info,
         action="admin_delete_title",
         entity_type="title",
         entity_id=title_id,
-        metadata={"name": title.name},
+        metadata={"name": title_name},
     )
     await session.commit()
 
@@ -604,8 +675,7 @@ async def create_season(
     admin_info: dict = Depends(get_admin_token),
     session: AsyncSession = Depends(get_db_session),
 ) -> dict:
-    title = await session.get(Title, title_id)
-    if not title:
+    if not await _row_exists(session, Title, title_id):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="title_not_found")
     season = Season(title_id=title_id, season_number=payload.season_number, name=payload.name)
     session.add(season)
@@ -619,7 +689,6 @@ async def create_season(
         metadata={"title_id": title_id, "season_number": payload.season_number},
     )
     await session.commit()
-    await session.refresh(season)
     return {"id": season.id}
 
 
@@ -630,11 +699,12 @@ async def create_episode(
     admin_info: dict = Depends(get_admin_token),
     session: AsyncSession = Depends(get_db_session),
 ) -> dict:
-    season = await session.get(Season, season_id)
-    if not season:
+    season_result = await session.execute(select(Season.title_id).where(Season.id == season_id))
+    title_id = season_result.scalar_one_or_none()
+    if title_id is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="season_not_found")
     episode = Episode(
-        title_id=season.title_id,
+        title_id=title_id,
         season_id=season_id,
         episode_number=payload.episode_number,
         name=payload.name,
@@ -649,10 +719,9 @@ async def create_episode(
         action="episode_created",
         entity_type="episode",
         entity_id=episode.id,
-        metadata={"title_id": season.title_id, "season_id": season_id},
+        metadata={"title_id": title_id, "season_id": season_id},
     )
     await session.commit()
-    await session.refresh(episode)
     return {"id": episode.id}
 
 
@@ -663,23 +732,18 @@ async def update_episode(
     admin_info: dict = Depends(get_admin_token),
     session: AsyncSession = Depends(get_db_session),
 ) -> dict:
-    episode = await session.get(Episode, episode_id)
-    if not episode:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="episode_not_found")
     update_data = payload.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(episode, key, value)
+    await _update_row(session, Episode, episode_id, update_data, "episode_not_found")
     await _log_admin_event(
         session,
         admin_info,
         action="episode_updated",
         entity_type="episode",
-        entity_id=episode.id,
+        entity_id=episode_id,
         metadata={"fields": list(update_data.keys())},
     )
     await session.commit()
-    await session.refresh(episode)
-    return {"id": episode.id}
+    return {"id": episode_id}
 
 
 @router.post("/episodes/{episode_id}/publish")
@@ -688,21 +752,20 @@ async def publish_episode(
     admin_info: dict = Depends(get_admin_token),
     session: AsyncSession = Depends(get_db_session),
 ) -> dict:
-    episode = await session.get(Episode, episode_id)
-    if not episode:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="episode_not_found")
-    episode.published_at = datetime.now(timezone.utc)
+    published_at = datetime.now(timezone.utc)
+    await _update_row(
+        session, Episode, episode_id, {"published_at": published_at}, "episode_not_found"
+    )
     await _log_admin_event(
         session,
         admin_info,
         action="episode_published",
         entity_type="episode",
-        entity_id=episode.id,
-        metadata={"published_at": episode.published_at.isoformat()},
+        entity_id=episode_id,
+        metadata={"published_at": published_at.isoformat()},
     )
     await session.commit()
-    await session.refresh(episode)
-    return {"id": episode.id, "published_at": episode.published_at}
+    return {"id": episode_id, "published_at": published_at}
 
 
 @router.get("/audio_tracks")
@@ -711,27 +774,18 @@ async def list_audio_tracks(
     offset: int = Query(default=0, ge=0),
     _: dict = Depends(get_admin_token),
     session: AsyncSession = Depends(get_db_session),
-) -> dict:
-    total_result = await session.execute(select(func.count()).select_from(AudioTrack))
-    total = total_result.scalar_one()
-    result = await session.execute(
-        select(AudioTrack).order_by(AudioTrack.id.desc()).limit(limit).offset(offset)
+) -> ORJSONResponse:
+    rows, total = await _fetch_page(
+        session, select(*_AUDIO_TRACK_COLUMNS), AudioTrack.id.desc(), limit, offset
+    )
+    return ORJSONResponse(
+        {
+            "items": _rows_to_items(rows, _AUDIO_TRACK_COLUMNS),
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+        }
     )
-    tracks = result.scalars().all()
-    return {
-        "items": [
-            {
-                "id": track.id,
-                "name": track.name,
-                "code": track.code,
-                "is_active": track.is_active,
-            }
-            for track in tracks
-        ],
-        "total": total,
-        "limit": limit,
-        "offset": offset,
-    }
 
 
 @router.post("/audio_tracks", status_code=status.HTTP_201_CREATED)
@@ -752,7 +806,6 @@ async def create_audio_track(
         metadata={"code": track.code},
     )
     await session.commit()
-    await session.refresh(track)
     return {"id": track.id}
 
 
@@ -763,23 +816,18 @@ async def update_audio_track(
     admin_info: dict = Depends(get_admin_token),
     session: AsyncSession = Depends(get_db_session),
 ) -> dict:
-    track = await session.get(AudioTrack, track_id)
-    if not track:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="audio_track_not_found")
     update_data = payload.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(track, key, value)
+    await _update_row(session, AudioTrack, track_id, update_data, "audio_track_not_found")
     await _log_admin_event(
         session,
         admin_info,
         action="audio_track_updated",
         entity_type="audio_track",
-        entity_id=track.id,
+        entity_id=track_id,
         metadata={"fields": list(update_data.keys())},
     )
     await session.commit()
-    await session.refresh(track)
-    return {"id": track.id}
+    return {"id": track_id}
 
 
 @router.delete("/audio_tracks/{track_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -788,9 +836,6 @@ async def delete_audio_track(
     admin_info: dict = Depends(get_admin_token),
     session: AsyncSession = Depends(get_db_session),
 ) -> None:
-    track = await session.get(AudioTrack, track_id)
-    if not track:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="audio_track_not_found")
     usage_result = await session.execute(
         select(func.count()).select_from(MediaVariant).where(MediaVariant.audio_id == track_id)
     )
@@ -800,14 +845,19 @@ async def delete_audio_track(
             status_code=status.HTTP_409_CONFLICT,
             content={"detail": "in_use", "count": usage_count},
         )
-    await session.delete(track)
+    delete_result = await session.execute(
+        delete(AudioTrack).where(AudioTrack.id == track_id).returning(AudioTrack.code)
+    )
+    code = delete_result.scalar_one_or_none()
+    if code is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="audio_track_not_found")
     await _log_admin_event(
         session,
         admin_info,
         action="admin_delete_audio",
         entity_type="audio_track",
         entity_id=track_id,
-        metadata={"code": track.code},
+        metadata={"code": code},
     )
     await session.commit()
 
@@ -818,27 +868,18 @@ async def list_qualities(
     offset: int = Query(default=0, ge=0),
     _: dict = Depends(get_admin_token),
     session: AsyncSession = Depends(get_db_session),
-) -> dict:
-    total_result = await session.execute(select(func.count()).select_from(Quality))
-    total = total_result.scalar_one()
-    result = await session.execute(
-        select(Quality).order_by(Quality.id.desc()).limit(limit).offset(offset)
+) -> ORJSONResponse:
+    rows, total = await _fetch_page(
+        session, select(*_QUALITY_COLUMNS), Quality.id.desc(), limit, offset
+    )
+    return ORJSONResponse(
+        {
+            "items": _rows_to_items(rows, _QUALITY_COLUMNS),
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+        }
     )
-    qualities = result.scalars().all()
-    return {
-        "items": [
-            {
-                "id": quality.id,
-                "name": quality.name,
-                "height": quality.height,
-                "is_active": quality.is_active,
-            }
-            for quality in qualities
-        ],
-        "total": total,
-        "limit": limit,
-        "offset": offset,
-    }
 
 
 @router.post("/qualities", status_code=status.HTTP_201_CREATED)
@@ -859,7 +900,6 @@ async def create_quality(
         metadata={"height": quality.height},
     )
     await session.commit()
-    await session.refresh(quality)
     return {"id": quality.id}
 
 
@@ -870,23 +910,18 @@ async def update_quality(
     admin_info: dict = Depends(get_admin_token),
     session: AsyncSession = Depends(get_db_session),
 ) -> dict:
-    quality = await session.get(Quality, quality_id)
-    if not quality:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="quality_not_found")
     update_data = payload.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(quality, key, value)
+    await _update_row(session, Quality, quality_id, update_data, "quality_not_found")
     await _log_admin_event(
         session,
         admin_info,
         action="quality_updated",
         entity_type="quality",
-        entity_id=quality.id,
+        entity_id=quality_id,
         metadata={"fields": list(update_data.keys())},
     )
     await session.commit()
-    await session.refresh(quality)
-    return {"id": quality.id}
+    return {"id": quality_id}
 
 
 @router.delete("/qualities/{quality_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -895,9 +930,6 @@ async def delete_quality(
     admin_info: dict = Depends(get_admin_token),
     session: AsyncSession = Depends(get_db_session),
 ) -> None:
-    quality = await session.get(Quality, quality_id)
-    if not quality:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="quality_not_found")
     usage_result = await session.execute(
         select(func.count()).select_from(MediaVariant).where(MediaVariant.quality_id == quality_id)
     )
@@ -907,14 +939,19 @@ async def delete_quality(
             status_code=status.HTTP_409_CONFLICT,
             detail={"code": "in_use", "count": usage_count},
         )
-    await session.delete(quality)
+    delete_result = await session.execute(
+        delete(Quality).where(Quality.id == quality_id).returning(Quality.height)
+    )
+    height = delete_result.scalar_one_or_none()
+    if height is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="quality_not_found")
     await _log_admin_event(
         session,
         admin_info,
         action="quality_deleted",
         entity_type="quality",
         entity_id=quality_id,
-        metadata={"height": quality.height},
+        metadata={"height": height},
     )
     await session.commit()
 
@@ -925,15 +962,7 @@ async def create_variant(
     admin_info: dict = Depends(get_admin_token),
     session: AsyncSession = Depends(get_db_session),
 ) -> dict:
-    title = await session.get(Title, payload.title_id)
-    if not title:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="title_not_found")
-    if payload.episode_id is not None:
-        episode = await session.get(Episode, payload.episode_id)
-        if not episode:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="episode_not_found")
-        if episode.title_id != payload.title_id:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="episode_title_mismatch")
+    await _validate_title_episode(session, payload.title_id, payload.episode_id)
     variant = MediaVariant(
         title_id=payload.title_id,
         episode_id=payload.episode_id,
@@ -946,7 +975,7 @@ async def create_variant(
         storage_message_id=payload.storage_message_id,
         duration_sec=payload.duration_sec,
         size_bytes=payload.size_bytes,
-        checksum_sha256=payload.checksum_sha256,
+        checksum_sha256=_checksum_bytes(payload.checksum_sha256),
     )
     session.add(variant)
     await session.flush()
@@ -963,7 +992,6 @@ async def create_variant(
         },
     )
     await session.commit()
-    await session.refresh(variant)
     return _serialize_variant(variant)
 
 
@@ -978,17 +1006,17 @@ async def update_variant(
     if not variant:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="variant_not_found")
     update_data = payload.model_dump(exclude_unset=True)
-    if "title_id" in update_data:
-        title = await session.get(Title, update_data["title_id"])
-        if not title:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="title_not_found")
+    if "title_id" in update_data and not await _row_exists(
+        session, Title, update_data["title_id"]
+    ):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="title_not_found")
     if "episode_id" in update_data and update_data["episode_id"] is not None:
-        episode = await session.get(Episode, update_data["episode_id"])
-        if not episode:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="episode_not_found")
-        if "title_id" in update_data and episode.title_id != update_data["title_id"]:
+        episode_title_id = await _episode_title_id(session, update_data["episode_id"])
+        if "title_id" in update_data and episode_title_id != update_data["title_id"]:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="episode_title_mismatch")
     for key, value in update_data.items():
+        if key == "checksum_sha256":
+            value = _checksum_bytes(value)
         setattr(variant, key, value)
     await _log_admin_event(
         session,
@@ -999,7 +1027,6 @@ async def update_variant(
         metadata={"fields": list(update_data.keys())},
     )
     await session.commit()
-    await session.refresh(variant)
     return _serialize_variant(variant)
 
 
@@ -1009,17 +1036,21 @@ async def delete_variant(
     admin_info: dict = Depends(get_admin_token),
     session: AsyncSession = Depends(get_db_session),
 ) -> None:
-    variant = await session.get(MediaVariant, variant_id)
-    if not variant:
+    delete_result = await session.execute(
+        delete(MediaVariant)
+        .where(MediaVariant.id == variant_id)
+        .returning(MediaVariant.title_id, MediaVariant.episode_id)
+    )
+    deleted = delete_result.first()
+    if deleted is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="variant_not_found")
-    await session.delete(variant)
     await _log_admin_event(
         session,
         admin_info,
         action="admin_delete_variant",
         entity_type="media_variant",
         entity_id=variant_id,
-        metadata={"title_id": variant.title_id, "episode_id": variant.episode_id},
+        metadata={"title_id": deleted.title_id, "episode_id": deleted.episode_id},
     )
     await session.commit()
 
@@ -1041,12 +1072,8 @@ async def list_variants(
         query = query.where(MediaVariant.episode_id == episode_id)
     if status:
         query = query.where(MediaVariant.status == status)
-    total_result = await session.execute(select(func.count()).select_from(query.subquery()))
-    total = total_result.scalar_one()
-    result = await session.execute(
-        query.order_by(MediaVariant.id.desc()).limit(limit).offset(offset)
-    )
-    variants = result.scalars().all()
+    rows, total = await _fetch_page(session, query, MediaVariant.id.desc(), limit, offset)
+    variants = [row[0] for row in rows]
     return {
         "items": [_serialize_variant(variant) for variant in variants],
         "total": total,
@@ -1068,8 +1095,7 @@ async def upload_media(
 ) -> VariantAttachFileResponse:
     episode_id_parsed = _parse_optional_int(episode_id)
     await _validate_title_episode(session, title_id, episode_id_parsed)
-    file_bytes = await file.read()
-    if not file_bytes:
+    if file.size == 0:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="empty_file")
     logger.info(
         "admin media upload start",
@@ -1081,11 +1107,11 @@ async def upload_media(
             "audio_id": audio_id,
             "quality_id": quality_id,
             "upload_filename": file.filename,
-            "size": len(file_bytes),
+            "size": file.size,
         },
     )
     file_id, message_id, chat_id = await _upload_to_telegram(
-        file_bytes, file.filename or "upload.bin", file.content_type, caption
+        file, file.filename or "upload.bin", file.content_type, caption
     )
     logger.info(
         "admin media upload tg ok",
@@ -1140,10 +1166,7 @@ async def list_users(
         if q.isdigit():
             filters.append(User.tg_user_id == int(q))
         query = query.where(or_(*filters))
-    total_result = await session.execute(select(func.count()).select_from(query.subquery()))
-    total = total_result.scalar_one()
-    result = await session.execute(query.order_by(User.id.desc()).limit(limit).offset(offset))
-    rows = result.all()
+    rows, total = await _fetch_page(session, query, User.id.desc(), limit, offset)
     return {
         "items": [
             {
@@ -1156,7 +1179,7 @@ async def list_users(
                 "ban_reason": user.ban_reason,
                 "created_at": user.created_at,
             }
-            for user, premium_until in rows
+            for user, premium_until, _total in rows
         ],
         "total": total,
         "limit": limit,
@@ -1294,10 +1317,7 @@ async def list_referrals(
         .join(referrer_alias, Referral.referrer_user_id == referrer_alias.c.id)
         .join(referred_alias, Referral.referred_user_id == referred_alias.c.id)
     )
-    total_result = await session.execute(select(func.count()).select_from(query.subquery()))
-    total = total_result.scalar_one()
-    result = await session.execute(query.order_by(Referral.id.desc()).limit(limit).offset(offset))
-    rows = result.all()
+    rows, total = await _fetch_page(session, query, Referral.id.desc(), limit, offset)
     items = []
     for row in rows:
         referral = row[0]
@@ -1341,12 +1361,7 @@ async def list_referral_rewards(
         .join(referrer_alias, ReferralReward.referrer_user_id == referrer_alias.c.id)
         .join(referred_alias, ReferralReward.referred_user_id == referred_alias.c.id)
     )
-    total_result = await session.execute(select(func.count()).select_from(query.subquery()))
-    total = total_result.scalar_one()
-    result = await session.execute(
-        query.order_by(ReferralReward.id.desc()).limit(limit).offset(offset)
-    )
-    rows = result.all()
+    rows, total = await _fetch_page(session, query, ReferralReward.id.desc(), limit, offset)
     items = []
     for row in rows:
         reward = row[0]
@@ -1,15 +1,15 @@
-import json
 import os
 import secrets
 from datetime import datetime, timezone
 
+import orjson
 from fastapi import APIRouter, Depends, status
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.dependencies import CurrentUser, get_current_user, get_db_session
-from app.redis import get_redis, json_set, setnx_with_ttl
+from app.redis import get_redis, setnx_and_json_set
 from app.services.rate_limit import check_rate_limit, rate_limit_response, register_violation
 
 router = APIRouter()
@@ -41,24 +41,22 @@ async def ads_start(
     cooldown_ttl = _get_ads_env_int("ADS_COOLDOWN_SECONDS", 90)
     nonce_ttl = _get_ads_env_int("ADS_NONCE_TTL_SECONDS", 300)
     cooldown_key = f"ad_cd:{user.tg_user_id}"
-    allowed = await setnx_with_ttl(cooldown_key, cooldown_ttl)
-    if not allowed:
-        redis = get_redis()
-        retry_after = await redis.ttl(cooldown_key)
-        retry_after = retry_after if retry_after and retry_after > 0 else cooldown_ttl
-        await register_violation(session, user.tg_user_id)
-        return JSONResponse(
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            content={"error": "ad_cooldown", "retry_after": retry_after},
-        )
-
     nonce = secrets.token_urlsafe(32)
     nonce_payload = {
         "tg_user_id": user.tg_user_id,
         "variant_id": payload.variant_id,
         "created_at": datetime.now(timezone.utc).isoformat(),
     }
-    await json_set(f"ad_nonce:{nonce}", nonce_ttl, nonce_payload)
+    allowed, retry_after = await setnx_and_json_set(
+        cooldown_key, cooldown_ttl, f"ad_nonce:{nonce}", nonce_ttl, nonce_payload
+    )
+    if not allowed:
+        retry_after = retry_after if retry_after > 0 else cooldown_ttl
+        await register_violation(session, user.tg_user_id)
+        return JSONResponse(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            content={"error": "ad_cooldown", "retry_after": retry_after},
+        )
 
     return {"nonce": nonce, "ttl": nonce_ttl}
 
@@ -83,7 +81,7 @@ async def ads_complete(
             content={"error": "invalid_or_expired_nonce"},
         )
 
-    nonce_payload = json.loads(raw_payload)
+    nonce_payload = orjson.loads(raw_payload)
     if nonce_payload.get("tg_user_id") != user.tg_user_id:
         return JSONResponse(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -1,12 +1,10 @@
-import json
 import logging
-import os
 import re
 from typing import Any
 
+import orjson
 from fastapi import APIRouter, Body, Depends, Header, HTTPException, Query, Request, status
 from pydantic import BaseModel
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.dependencies import (
@@ -16,8 +14,12 @@ from app.dependencies import (
     _validate_init_data,
     get_db_session,
 )
-from app.models import UserPremium
-from app.dependencies import _get_dev_user_id, _is_dev_bypass_allowed, _upsert_user
+from app.dependencies import (
+    _get_dev_user_id,
+    _is_dev_bypass_allowed,
+    _is_webapp_debug_enabled,
+    _upsert_user_with_premium,
+)
 from app.services.rate_limit import rate_limit_response, register_violation
 from app.services.referrals import (
     ReferralRateLimitError,
@@ -29,10 +31,6 @@ router = APIRouter()
 logger = logging.getLogger("kina.api")
 
 
-def _is_webapp_debug_enabled() -> bool:
-    return os.getenv("AUTH_WEBAPP_DEBUG", "0") == "1"
-
-
 class WebAppAuthRequest(BaseModel):
     initData: str | None = None
     ref: str | None = None
@@ -49,13 +47,6 @@ class WebAppAuthResponse(BaseModel):
     expires_in: int
 
 
-async def _get_premium_until(session: AsyncSession, user_id: int) -> Any | None:
-    result = await session.execute(
-        select(UserPremium.premium_until).where(UserPremium.user_id == user_id)
-    )
-    return result.scalar_one_or_none()
-
-
 @router.post("/auth/webapp", response_model=WebAppAuthResponse)
 async def auth_webapp(
     request: Request,
@@ -93,7 +84,7 @@ async def auth_webapp(
         )
     if _is_dev_bypass_allowed() and not init_data:
         tg_user_id = _get_dev_user_id(dev_user_id or x_dev_user_id)
-        user = await _upsert_user(session, tg_user_id, None, None, None)
+        user, premium_until = await _upsert_user_with_premium(session, tg_user_id, None, None, None)
         _ensure_not_banned(user)
         if referral_code:
             try:
@@ -106,7 +97,6 @@ async def auth_webapp(
             except ReferralRateLimitError as exc:
                 await register_violation(session, tg_user_id)
                 return rate_limit_response(exc.retry_after)
-        premium_until = await _get_premium_until(session, user.id)
         access_token, expires_in = _issue_access_token(user)
         return WebAppAuthResponse(
             id=user.id,
@@ -180,9 +170,9 @@ async def auth_webapp(
                 "auth_date": parsed.get("auth_date"),
             },
         )
-    user_payload = json.loads(raw_user)
+    user_payload = orjson.loads(raw_user)
     tg_user_id = int(user_payload["id"])
-    user = await _upsert_user(
+    user, premium_until = await _upsert_user_with_premium(
         session,
         tg_user_id,
         user_payload.get("username"),
@@ -201,7 +191,6 @@ async def auth_webapp(
         except ReferralRateLimitError as exc:
             await register_violation(session, tg_user_id)
             return rate_limit_response(exc.retry_after)
-    premium_until = await _get_premium_until(session, user.id)
     access_token, expires_in = _issue_access_token(user)
     return WebAppAuthResponse(
         id=user.id,
@@ -22,7 +22,7 @@ def _parse_period(period: str) -> timedelta:
 def _title_to_dict(title: Title) -> dict:
     return {
         "id": title.id,
-        "type": title.type.value,
+        "type": title.type,
         "name": title.name,
         "original_name": title.original_name,
         "description": title.description,
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import delete, literal, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.dependencies import CurrentUser, get_current_user, get_db_session
@@ -12,7 +13,7 @@ router = APIRouter()
 def _title_to_dict(title: Title) -> dict:
     return {
         "id": title.id,
-        "type": title.type.value,
+        "type": title.type,
         "name": title.name,
         "original_name": title.original_name,
         "description": title.description,
@@ -46,23 +47,28 @@ async def toggle_favorite(
     user: CurrentUser = Depends(get_current_user),
     session: AsyncSession = Depends(get_db_session),
 ) -> dict:
-    result = await session.execute(
-        select(Favorite).where(
+    deleted = await session.execute(
+        delete(Favorite)
+        .where(
             Favorite.user_id == user.id,
             Favorite.title_id == payload.title_id,
         )
+        .returning(Favorite.title_id)
     )
-    favorite = result.scalar_one_or_none()
-    if favorite:
-        await session.delete(favorite)
+    if deleted.first() is not None:
         await session.commit()
         return {"title_id": payload.title_id, "favorited": False}
 
-    title_result = await session.execute(select(Title).where(Title.id == payload.title_id))
-    title = title_result.scalar_one_or_none()
-    if not title:
+    inserted = await session.execute(
+        pg_insert(Favorite)
+        .from_select(
+            ["user_id", "title_id"],
+            select(literal(user.id), Title.id).where(Title.id == payload.title_id),
+        )
+        .on_conflict_do_nothing(index_elements=[Favorite.user_id, Favorite.title_id])
+        .returning(Favorite.title_id)
+    )
+    if inserted.first() is None and not await session.get(Title, payload.title_id):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="title_not_found")
-
-    session.add(Favorite(user_id=user.id, title_id=payload.title_id))
     await session.commit()
     return {"title_id": payload.title_id, "favorited": True}
@@ -1,12 +1,19 @@
 import json
 import os
+from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.dependencies import get_db_session, get_service_token, is_premium_active, _upsert_user
+from app.dependencies import (
+    _upsert_user,
+    get_db_session,
+    get_service_token,
+    is_premium_active,
+    load_user_with_premium,
+)
 from app.models import (
     Favorite,
     MediaVariant,
@@ -14,7 +21,6 @@ from app.models import (
     Title,
     TitleType,
     User,
-    UserPremium,
 )
 from app.redis import get_redis, json_set, setnx_with_ttl
 from app.services.rate_limit import rate_limit_response, register_violation
@@ -158,8 +164,7 @@ async def toggle_favorite_internal(
         await session.commit()
         return {"title_id": payload.title_id, "favorited": False}
 
-    title_result = await session.execute(select(Title).where(Title.id == payload.title_id))
-    title = title_result.scalar_one_or_none()
+    title = await session.get(Title, payload.title_id)
     if not title:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="title_not_found")
 
@@ -214,9 +219,7 @@ async def watch_request_internal(
     if not variant:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="variant_not_found")
 
-    user = await _get_or_create_user(session, payload.tg_user_id)
-
-    premium_until = await _get_premium_until(session, payload.tg_user_id)
+    _, premium_until = await _get_or_create_user_with_premium(session, payload.tg_user_id)
     premium_active = is_premium_active(premium_until)
     mode = "direct" if premium_active else "ad_gate"
     if not premium_active:
@@ -337,24 +340,25 @@ async def get_metrics(
     queue_lengths = {queue: await redis.llen(queue) for queue in queues}
 
     variant_statuses = ["pending", "ready", "failed"]
-    variant_counts = {}
-    for status_name in variant_statuses:
-        result = await session.execute(
-            select(func.count()).select_from(MediaVariant).where(MediaVariant.status == status_name)
-        )
-        variant_counts[status_name] = result.scalar_one()
+    variant_result = await session.execute(
+        select(MediaVariant.status, func.count())
+        .where(MediaVariant.status.in_(variant_statuses))
+        .group_by(MediaVariant.status)
+    )
+    variant_counts = dict.fromkeys(variant_statuses, 0)
+    variant_counts.update(variant_result.tuples().all())
 
-    users_total = await session.execute(select(func.count()).select_from(User))
-    users_banned = await session.execute(
-        select(func.count()).select_from(User).where(User.is_banned.is_(True))
+    users_result = await session.execute(
+        select(func.count(), func.count().filter(User.is_banned.is_(True))).select_from(User)
     )
+    users_total, users_banned = users_result.one()
 
     ads_passes = await _count_keys(redis, "ad_pass:*")
 
     return {
         "queue_lengths": queue_lengths,
         "variants": variant_counts,
-        "users": {"total": users_total.scalar_one(), "banned": users_banned.scalar_one()},
+        "users": {"total": users_total, "banned": users_banned},
         "ads": {"passes_active_estimate": ads_passes},
     }
 
@@ -365,8 +369,7 @@ async def _toggle_subscription(
     title_id: int,
 ) -> dict:
     user = await _get_or_create_user(session, tg_user_id)
-    title_result = await session.execute(select(Title).where(Title.id == title_id))
-    title = title_result.scalar_one_or_none()
+    title = await session.get(Title, title_id)
     if not title:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="title_not_found")
     if title.type != TitleType.SERIES:
@@ -396,15 +399,16 @@ async def _get_or_create_user(session: AsyncSession, tg_user_id: int) -> User:
     user = User(tg_user_id=tg_user_id)
     session.add(user)
     await session.commit()
-    await session.refresh(user)
     return user
 
 
-async def _get_premium_until(session: AsyncSession, tg_user_id: int):
-    result = await session.execute(
-        select(UserPremium)
-        .join(User, UserPremium.user_id == User.id)
-        .where(User.tg_user_id == tg_user_id)
-    )
-    record = result.scalar_one_or_none()
-    return record.premium_until if record else None
+async def _get_or_create_user_with_premium(
+    session: AsyncSession, tg_user_id: int
+) -> tuple[User, datetime | None]:
+    loaded = await load_user_with_premium(session, tg_user_id)
+    if loaded is not None:
+        return loaded
+    user = User(tg_user_id=tg_user_id)
+    session.add(user)
+    await session.commit()
+    return user, None
@@ -34,8 +34,7 @@ async def toggle_subscription(
     user: CurrentUser = Depends(get_current_user),
     session: AsyncSession = Depends(get_db_session),
 ) -> dict:
-    title_result = await session.execute(select(Title).where(Title.id == payload.title_id))
-    title = title_result.scalar_one_or_none()
+    title = await session.get(Title, payload.title_id)
     if not title:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="title_not_found")
     if title.type != TitleType.SERIES:
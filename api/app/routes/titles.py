@@ -11,7 +11,7 @@ router = APIRouter()
 def _title_to_dict(title: Title) -> dict:
     return {
         "id": title.id,
-        "type": title.type.value,
+        "type": title.type,
         "name": title.name,
         "original_name": title.original_name,
         "description": title.description,
@@ -26,8 +26,7 @@ async def get_title(
     title_id: int,
     session: AsyncSession = Depends(get_db_session),
 ) -> dict:
-    result = await session.execute(select(Title).where(Title.id == title_id))
-    title = result.scalar_one_or_none()
+    title = await session.get(Title, title_id)
     if not title:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="title_not_found")
 
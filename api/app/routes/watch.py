@@ -131,10 +131,10 @@ async def watch_request(
 
 @router.post("/watch/resolve", response_model=WatchResolveResponse)
 async def watch_resolve(
+    request: Request,
     payload: WatchResolveRequest,
     user: CurrentUser = Depends(get_current_user),
     session: AsyncSession = Depends(get_db_session),
-    request: Request,
 ) -> WatchResolveResponse:
     logger.info(
         "watch resolve request",
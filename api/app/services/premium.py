@@ -45,5 +45,4 @@ async def apply_premium_days(
         )
 
     await session.commit()
-    await session.refresh(premium)
     return premium.premium_until
@@ -1,6 +1,8 @@
 import hashlib
+import time
 from dataclasses import dataclass
 
+from cachetools import TTLCache
 from fastapi import status
 from fastapi.responses import JSONResponse
 from sqlalchemy import select
@@ -30,6 +32,18 @@ async def check_rate_limit(key: str, limit: int, window_seconds: int) -> RateLim
     return RateLimitResult(allowed=current <= limit, retry_after=ttl)
 
 
+_local_denials: TTLCache[str, float] = TTLCache(maxsize=10_000, ttl=60)
+
+
+def is_locally_denied(key: str) -> bool:
+    deny_until = _local_denials.get(key)
+    return deny_until is not None and time.monotonic() < deny_until
+
+
+def remember_denial(key: str, retry_after: int) -> None:
+    _local_denials[key] = time.monotonic() + retry_after
+
+
 def rate_limit_response(retry_after: int) -> JSONResponse:
     return JSONResponse(
         status_code=status.HTTP_429_TOO_MANY_REQUESTS,
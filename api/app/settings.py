@@ -6,6 +6,12 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
     database_url: str = Field(..., validation_alias="DATABASE_URL")
+    db_pool_size: int = Field(20, validation_alias="DB_POOL_SIZE")
+    db_max_overflow: int = Field(10, validation_alias="DB_MAX_OVERFLOW")
+    db_pool_timeout: int = Field(30, validation_alias="DB_POOL_TIMEOUT")
+    db_pool_recycle: int = Field(1800, validation_alias="DB_POOL_RECYCLE")
+    redis_max_connections: int = Field(256, validation_alias="REDIS_MAX_CONNECTIONS")
+    redis_pool_timeout: int = Field(5, validation_alias="REDIS_POOL_TIMEOUT")
 
     model_config = SettingsConfigDict(
         env_file=None,
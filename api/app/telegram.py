@@ -0,0 +1,20 @@
+import httpx
+
+_telegram_client: httpx.AsyncClient | None = None
+
+
+def get_telegram_client() -> httpx.AsyncClient:
+    global _telegram_client
+    if _telegram_client is None:
+        _telegram_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(60.0),
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        )
+    return _telegram_client
+
+
+async def close_telegram_client() -> None:
+    global _telegram_client
+    if _telegram_client is not None:
+        await _telegram_client.aclose()
+        _telegram_client = None
@@ -3,7 +3,7 @@ from datetime import datetime, timezone
 
 from sqlalchemy import select
 
-from app.db.session import SessionLocal
+from app.db import SessionLocal
 from app.models import (
     Admin,
     AudioTrack,
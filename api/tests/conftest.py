@@ -0,0 +1,57 @@
+import pytest
+
+from app import dependencies
+from app import redis as redis_helpers
+from app.env_cache import clear_env_cache
+
+
+class FakeResult:
+    def __init__(self, rows: list) -> None:
+        self._rows = rows
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def all(self) -> list:
+        return self._rows
+
+    def first(self):
+        return self._rows[0] if self._rows else None
+
+    def scalar_one(self):
+        return self._rows[0]
+
+    def scalar_one_or_none(self):
+        return self._rows[0] if self._rows else None
+
+
+class FakeSession:
+    def __init__(self) -> None:
+        self.results: list[list] = []
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        return FakeResult(self.results.pop(0))
+
+
+@pytest.fixture(autouse=True)
+def clear_env_caches():
+    yield
+    clear_env_cache()
+    dependencies._verified_tokens.clear()
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+    monkeypatch.setattr(redis_helpers, "_redis_client", redis)
+    monkeypatch.setattr(redis_helpers, "_setnx_and_json_set_script", None)
+    return redis
+
+
+@pytest.fixture
+def fake_session() -> FakeSession:
+    return FakeSession()
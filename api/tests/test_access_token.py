@@ -0,0 +1,98 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import jwt
+import pytest
+from fastapi import HTTPException
+
+from app import dependencies
+from app.dependencies import _decode_access_token, _issue_access_token
+from app.middleware import AuthASGIMiddleware
+
+
+SECRET = "test-jwt-secret"
+
+
+@pytest.fixture(autouse=True)
+def jwt_secret(monkeypatch):
+    monkeypatch.setenv("JWT_SECRET", SECRET)
+
+
+def _encode(**claims) -> str:
+    payload = {"sub": "42", "tg_user_id": 4242, "exp": int(time.time()) + 600, **claims}
+    return jwt.encode(payload, SECRET, algorithm="HS256")
+
+
+def test_decodes_pyjwt_token() -> None:
+    payload = _decode_access_token(_encode())
+    assert payload["sub"] == "42"
+    assert payload["tg_user_id"] == 4242
+
+
+def test_issued_token_round_trip() -> None:
+    token, _ = _issue_access_token(SimpleNamespace(id=7, tg_user_id=700))
+    assert jwt.decode(token, SECRET, algorithms=["HS256"])["sub"] == "7"
+    assert _decode_access_token(token)["tg_user_id"] == 700
+
+
+def test_expired_token() -> None:
+    with pytest.raises(HTTPException) as exc_info:
+        _decode_access_token(_encode(exp=int(time.time()) - 1))
+    assert exc_info.value.detail == "token_expired"
+
+
+@pytest.mark.parametrize(
+    "token",
+    [
+        jwt.encode({"sub": "42", "exp": int(time.time()) + 600}, "other", algorithm="HS256"),
+        jwt.encode({"sub": "42", "exp": int(time.time()) + 600}, SECRET, algorithm="HS512"),
+        jwt.encode({"sub": "42"}, SECRET, algorithm="HS256"),
+        "not-a-token",
+        "a.b.c",
+    ],
+)
+def test_invalid_token(token: str) -> None:
+    with pytest.raises(HTTPException) as exc_info:
+        _decode_access_token(token)
+    assert exc_info.value.detail == "token_invalid"
+
+
+def test_verified_token_is_cached(monkeypatch) -> None:
+    token = _encode()
+    _decode_access_token(token)
+
+    def fail(token: str, secret: bytes) -> dict:
+        raise AssertionError("token verified twice")
+
+    monkeypatch.setattr(dependencies, "_fast_decode_hs256", fail)
+    assert _decode_access_token(token)["sub"] == "42"
+
+
+def test_middleware_stores_missing_secret(monkeypatch) -> None:
+    monkeypatch.delenv("JWT_SECRET")
+    monkeypatch.delenv("BOT_TOKEN", raising=False)
+
+    async def app(scope, receive, send) -> None:
+        return None
+
+    scope = {"type": "http", "headers": [(b"authorization", b"Bearer " + _encode().encode())]}
+    asyncio.run(AuthASGIMiddleware(app)(scope, None, None))
+    assert scope["state"] == {"auth_error": (500, "jwt_secret_missing")}
+
+
+def test_middleware_stores_token_error() -> None:
+    async def app(scope, receive, send) -> None:
+        return None
+
+    scope = {"type": "http", "headers": [(b"authorization", b"Bearer not-a-token")]}
+    asyncio.run(AuthASGIMiddleware(app)(scope, None, None))
+    assert scope["state"] == {"auth_error": (401, "token_invalid")}
+
+
+def test_current_user_raises_stored_auth_error() -> None:
+    request = SimpleNamespace(state=SimpleNamespace(auth_error=(500, "jwt_secret_missing")))
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(dependencies.get_current_user(request, session=None))
+    assert exc_info.value.status_code == 500
+    assert exc_info.value.detail == "jwt_secret_missing"
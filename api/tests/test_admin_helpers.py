@@ -0,0 +1,36 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app.routes import admin
+
+
+def test_validate_title_episode_rejects_missing_title(fake_session) -> None:
+    fake_session.results = [[]]
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(admin._validate_title_episode(fake_session, 7, 3))
+
+    assert exc_info.value.status_code == 404
+    assert exc_info.value.detail == "title_not_found"
+    assert len(fake_session.statements) == 1
+
+
+def test_validate_title_episode_rejects_foreign_episode(fake_session) -> None:
+    fake_session.results = [[1], [8]]
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(admin._validate_title_episode(fake_session, 7, 3))
+
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.detail == "episode_title_mismatch"
+    assert len(fake_session.statements) == 2
+
+
+def test_validate_title_episode_accepts_matching_episode(fake_session) -> None:
+    fake_session.results = [[1], [7]]
+
+    asyncio.run(admin._validate_title_episode(fake_session, 7, 3))
+
+    assert len(fake_session.statements) == 2
@@ -0,0 +1,77 @@
+import asyncio
+import json
+from collections import namedtuple
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
+
+from app.routes import admin
+
+
+def test_rows_to_items_drops_window_total() -> None:
+    rows = [(1, "Main", 1080, True, 3)]
+
+    items = admin._rows_to_items(rows, admin._QUALITY_COLUMNS)
+
+    assert items == [{"id": 1, "name": "Main", "height": 1080, "is_active": True}]
+
+
+def test_get_title_serializes_seasons_and_episodes(fake_session) -> None:
+    created_at = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    TitleRow = namedtuple("TitleRow", [column.key for column in admin._TITLE_COLUMNS])
+    title = TitleRow(
+        id=7,
+        type="series",
+        name="Show",
+        original_name=None,
+        description=None,
+        year=2026,
+        poster_url=None,
+        is_published=True,
+        created_at=created_at,
+        updated_at=created_at,
+    )
+    first = SimpleNamespace(id=1, season_number=1, name=None, created_at=created_at)
+    second = SimpleNamespace(id=2, season_number=2, name="S2", created_at=created_at)
+    episode = SimpleNamespace(
+        id=10,
+        episode_number=1,
+        name="Pilot",
+        description=None,
+        air_date=date(2026, 1, 1),
+        published_at=None,
+        created_at=created_at,
+    )
+    fake_session.results = [[title], [(first, episode), (second, None)]]
+
+    response = asyncio.run(admin.get_title(7, {}, fake_session))
+
+    body = json.loads(response.body)
+    assert body["id"] == 7
+    assert body["type"] == "series"
+    assert body["created_at"] == "2026-01-02T03:04:05+00:00"
+    assert body["seasons"] == [
+        {
+            "id": 1,
+            "season_number": 1,
+            "name": None,
+            "created_at": "2026-01-02T03:04:05+00:00",
+            "episodes": [
+                {
+                    "id": 10,
+                    "episode_number": 1,
+                    "name": "Pilot",
+                    "description": None,
+                    "air_date": "2026-01-01",
+                    "published_at": None,
+                    "created_at": "2026-01-02T03:04:05+00:00",
+                }
+            ],
+        },
+        {
+            "id": 2,
+            "season_number": 2,
+            "name": "S2",
+            "created_at": "2026-01-02T03:04:05+00:00",
+            "episodes": [],
+        },
+    ]
@@ -0,0 +1,31 @@
+import asyncio
+from types import SimpleNamespace
+
+from sqlalchemy import select
+
+from app.models import Title
+from app.routes import admin
+
+
+def test_fetch_page_reads_total_from_window(fake_session) -> None:
+    rows = [SimpleNamespace(total=7), SimpleNamespace(total=7)]
+    fake_session.results = [rows]
+
+    page, total = asyncio.run(admin._fetch_page(fake_session, select(Title), Title.id.desc(), 2, 0))
+
+    assert page == rows
+    assert total == 7
+    assert len(fake_session.statements) == 1
+    assert "count(*) OVER ()" in str(fake_session.statements[0])
+
+
+def test_fetch_page_counts_when_offset_is_past_the_end(fake_session) -> None:
+    fake_session.results = [[], [7]]
+
+    page, total = asyncio.run(
+        admin._fetch_page(fake_session, select(Title), Title.id.desc(), 2, 10)
+    )
+
+    assert page == []
+    assert total == 7
+    assert len(fake_session.statements) == 2
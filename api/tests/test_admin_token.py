@@ -0,0 +1,45 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app import dependencies
+
+
+@pytest.fixture(autouse=True)
+def no_rate_limit(monkeypatch):
+    async def allow(key: str, limit: int) -> None:
+        return None
+
+    monkeypatch.setattr(dependencies, "_rate_limit_by_key", allow)
+
+
+def test_admin_token_checks_allowlist(monkeypatch) -> None:
+    monkeypatch.setenv("ADMIN_SERVICE_TOKEN", "admin-secret")
+    monkeypatch.setenv("ADMIN_ALLOWLIST", "10, 20")
+
+    assert asyncio.run(dependencies.get_admin_token("admin-secret", "20")) == {"tg_user_id": 20}
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(dependencies.get_admin_token("admin-secret", "30"))
+    assert exc_info.value.detail == "admin_user_not_allowed"
+
+
+@pytest.mark.parametrize("provided", [None, "", "wrong", "admin-secreté"])
+def test_admin_token_rejects_mismatch(monkeypatch, provided) -> None:
+    monkeypatch.setenv("ADMIN_SERVICE_TOKEN", "admin-secret")
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(dependencies.get_admin_token(provided, None))
+    assert exc_info.value.detail == "invalid_admin_token"
+
+
+def test_service_token_requires_configured_secret(monkeypatch) -> None:
+    monkeypatch.delenv("SERVICE_TOKEN", raising=False)
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(dependencies.get_service_token("anything"))
+    assert exc_info.value.detail == "invalid_service_token"
+
+
+def test_rate_limit_key_matches_hash_token() -> None:
+    assert dependencies._token_rate_limit_key(b"admin-secret") == (
+        f"ratelimit:token:{dependencies.hash_token('admin-secret')}"
+    )
@@ -0,0 +1,19 @@
+import asyncio
+
+from app.db import SessionLocal, engine, get_request_session
+from app.dependencies import get_db_session
+
+
+def test_sessions_share_single_engine() -> None:
+    assert SessionLocal.kw["bind"] is engine
+
+
+def test_db_session_is_request_scoped() -> None:
+    async def _run() -> None:
+        first = await get_db_session()
+        second = await get_db_session()
+        assert first is second
+        assert get_request_session() is first
+        await first.close()
+
+    asyncio.run(_run())
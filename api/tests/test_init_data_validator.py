@@ -58,3 +58,13 @@ class InitDataValidatorTests(unittest.TestCase):
         init_data = _build_init_data(payload)
         with self.assertRaises(HTTPException):
             _validate_init_data(init_data[:-12], BOT_TOKEN)
+
+    def test_malformed_hash(self) -> None:
+        payload = {
+            "auth_date": str(int(time.time())),
+            "query_id": "AAH2E_321",
+        }
+        for bad_hash in ("abc", "z" * 64, "é" * 64):
+            init_data = urlencode({**payload, "hash": bad_hash}, quote_via=quote)
+            with self.assertRaises(HTTPException):
+                _validate_init_data(init_data, BOT_TOKEN)
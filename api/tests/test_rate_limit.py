@@ -0,0 +1,25 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app import dependencies
+from app.services import rate_limit
+from app.services.rate_limit import RateLimitResult
+
+
+def test_denied_token_skips_redis_until_reset(monkeypatch) -> None:
+    calls = []
+
+    async def fake_check_rate_limit(key: str, limit: int, window_seconds: int) -> RateLimitResult:
+        calls.append(key)
+        return RateLimitResult(allowed=False, retry_after=30)
+
+    monkeypatch.setattr(dependencies, "check_rate_limit", fake_check_rate_limit)
+    monkeypatch.setattr(rate_limit, "_local_denials", rate_limit.TTLCache(maxsize=10, ttl=60))
+
+    for _ in range(3):
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(dependencies._rate_limit_by_key("ratelimit:token:abc", 120))
+        assert exc_info.value.status_code == 429
+    assert len(calls) == 1
@@ -0,0 +1,27 @@
+import asyncio
+import json
+
+from app import redis as redis_helpers
+
+
+def _setnx(data_key: str, variant_id: int) -> tuple[bool, int]:
+    return asyncio.run(
+        redis_helpers.setnx_and_json_set("lock", 90, data_key, 300, {"variant_id": variant_id})
+    )
+
+
+def test_acquired_lock_writes_data_with_ttls(fake_redis) -> None:
+    assert _setnx("data:1", 7) == (True, 0)
+    assert json.loads(asyncio.run(fake_redis.get("data:1"))) == {"variant_id": 7}
+    assert asyncio.run(fake_redis.get("lock")) == "1"
+    assert asyncio.run(fake_redis.ttl("lock")) == 90
+    assert asyncio.run(fake_redis.ttl("data:1")) == 300
+
+
+def test_denied_lock_skips_data_and_returns_ttl(fake_redis) -> None:
+    _setnx("data:1", 7)
+    asyncio.run(fake_redis.expire("lock", 42))
+
+    assert _setnx("data:2", 8) == (False, 42)
+    assert asyncio.run(fake_redis.get("data:2")) is None
+    assert asyncio.run(fake_redis.ttl("lock")) == 42
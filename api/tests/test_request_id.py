@@ -0,0 +1,8 @@
+from app.main import _REQUEST_ID_BATCH, _new_request_id
+
+
+def test_request_ids_are_unique_across_refills() -> None:
+    ids = [_new_request_id() for _ in range(_REQUEST_ID_BATCH * 3)]
+    assert len(set(ids)) == len(ids)
+    assert all(len(request_id) == 32 for request_id in ids)
+    assert all(int(request_id, 16) >= 0 for request_id in ids)
@@ -0,0 +1,55 @@
+import asyncio
+import io
+
+import httpx
+from starlette.datastructures import UploadFile
+
+from app import telegram
+from app.routes import admin
+
+
+def test_upload_falls_back_to_send_document(monkeypatch) -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path.endswith("/sendVideo"):
+            return httpx.Response(400, json={"ok": False, "description": "bad video"})
+        return httpx.Response(
+            200,
+            json={
+                "ok": True,
+                "result": {
+                    "message_id": 11,
+                    "chat": {"id": -100},
+                    "document": {"file_id": "doc-file"},
+                },
+            },
+        )
+
+    monkeypatch.setenv("BOT_TOKEN", "123:abc")
+    monkeypatch.setenv("STORAGE_CHAT_ID", "-100")
+    monkeypatch.setattr(
+        telegram, "_telegram_client", httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+
+    result = asyncio.run(
+        admin._upload_to_telegram(
+            UploadFile(io.BytesIO(b"video-bytes"), size=11, filename="clip.mp4"),
+            "clip.mp4",
+            "video/mp4",
+            "caption",
+        )
+    )
+
+    assert result == ("doc-file", 11, -100)
+    assert [request.url.path for request in requests] == [
+        "/bot123:abc/sendVideo",
+        "/bot123:abc/sendDocument",
+    ]
+    for request in requests:
+        assert int(request.headers["content-length"]) == len(request.content)
+        assert b"\r\n\r\nvideo-bytes\r\n" in request.content
+    assert b'name="video"; filename="clip.mp4"' in requests[0].content
+    assert b'name="document"; filename="clip.mp4"' in requests[1].content
+    assert b'name="chat_id"\r\n\r\n-100\r\n' in requests[1].content